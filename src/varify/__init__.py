@@ -1,6 +1,3 @@
-from .core import VcfType, parse_vcf
-from .reporting.html_generator import generate_combined_report
-
 __all__ = [
     "parse_vcf",
     "VcfType",
@@ -8,3 +5,26 @@ __all__ = [
 ]
 
 __version__ = "1.0.0"
+
+# Exports are resolved on first access (PEP 562) so that importing the package,
+# e.g. for `varify --help`, does not load pandas, vcfpy and pysam up front.
+_LAZY_EXPORTS = {
+    "parse_vcf": ".core",
+    "VcfType": ".core",
+    "generate_combined_report": ".reporting.html_generator",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,11 +1,8 @@
 """
-CLI entry point
+Allow running Varify with `python -m varify`.
 """
 
 from .cli import main
 
-__all__ = ["main"]
-
-
 if __name__ == "__main__":
     main()
@@ -6,6 +6,15 @@
  */
 
 import { parseSuppCallers } from "../utils/DataValidation.js";
+import { escapeHtml } from "../utils/HtmlUtils.js";
+
+// Select All / Clear buttons are the same for every column, so the markup is built once
+const BUTTONS_HTML = `
+            <div style="margin-bottom: 8px; display: flex; gap: 4px;">
+                <button class="select-all-btn" style="flex: 1; padding: 4px 8px; font-size: 12px; cursor: pointer;">Select All</button>
+                <button class="clear-all-btn" style="flex: 1; padding: 4px 8px; font-size: 12px; cursor: pointer;">Clear</button>
+            </div>
+        `;
 
 export class CategoricalFilter {
   /**
@@ -23,25 +32,20 @@ export class CategoricalFilter {
     this.eGui.style.maxHeight = "300px";
     this.eGui.style.overflowY = "auto";
 
-    const buttonsHtml = `
-            <div style="margin-bottom: 8px; display: flex; gap: 4px;">
-                <button class="select-all-btn" style="flex: 1; padding: 4px 8px; font-size: 12px; cursor: pointer;">Select All</button>
-                <button class="clear-all-btn" style="flex: 1; padding: 4px 8px; font-size: 12px; cursor: pointer;">Clear</button>
-            </div>
-        `;
-
+    // Escape each value once; it is used both as the attribute value and the label
     const checkboxesHtml = this.uniqueValues
-      .map(
-        (value) => `
+      .map((value) => {
+        const escaped = escapeHtml(value);
+        return `
             <label style="display: block; padding: 4px 0; cursor: pointer; user-select: none;">
-                <input type="checkbox" value="${this.escapeHtml(value)}" style="margin-right: 6px;">
-                <span>${this.escapeHtml(value)}</span>
+                <input type="checkbox" value="${escaped}" style="margin-right: 6px;">
+                <span>${escaped}</span>
             </label>
-        `
-      )
+        `;
+      })
       .join("");
 
-    this.eGui.innerHTML = buttonsHtml + checkboxesHtml;
+    this.eGui.innerHTML = BUTTONS_HTML + checkboxesHtml;
 
     this.selectAllBtn = this.eGui.querySelector(".select-all-btn");
     this.clearAllBtn = this.eGui.querySelector(".clear-all-btn");
@@ -198,15 +202,4 @@ export class CategoricalFilter {
       this.clearAllBtn.removeEventListener("click", this.clearAll);
     }
   }
-
-  /**
-   * Escape HTML to prevent XSS
-   * @param {string} text
-   * @returns {string}
-   */
-  escapeHtml(text) {
-    const div = document.createElement("div");
-    div.textContent = String(text);
-    return div.innerHTML;
-  }
 }
@@ -280,7 +280,7 @@ export class IGVIntegration {
       window.bcfIGVBrowser = this.bcfIGVBrowser;
 
       if (onTableCreated) {
-        onTableCreated("bcf", this.bcfVariants, this.bcfIGVBrowser, this.bcfHeader);
+        onTableCreated("bcf", this.bcfIGVBrowser, this.bcfHeader);
       }
 
       logger.info("BCF IGV browser and table ready");
@@ -350,12 +350,7 @@ export class IGVIntegration {
       window.survivorIGVBrowser = this.survivorIGVBrowser;
 
       if (onTableCreated) {
-        onTableCreated(
-          "survivor",
-          this.survivorVariants,
-          this.survivorIGVBrowser,
-          this.survivorHeader
-        );
+        onTableCreated("survivor", this.survivorIGVBrowser, this.survivorHeader);
       }
 
       logger.info("SURVIVOR IGV browser and table ready");
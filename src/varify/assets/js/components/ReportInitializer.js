@@ -4,7 +4,6 @@
 
 import { VarifyPlots } from "./visualization/VarifyPlots.js";
 import { VariantTableAGGrid } from "./VariantTableAGGrid.js";
-import { MetadataService } from "../services/MetadataService.js";
 import { SectionGenerator } from "./SectionGenerator.js";
 import { TabManager } from "./TabManager.js";
 import { EmptyState } from "./EmptyState.js";
@@ -333,17 +332,15 @@ export class ReportInitializer {
       logger.debug(`Initializing UI for ${tabId}...`);
       SectionGenerator.initializeTab(tabId, tabMetadata);
 
-      logger.debug(`Initializing IGV for ${tabId}...`);
-      if (tabId === "bcf") {
-        await this.igvIntegration.initializeBCFIGV(this.createVariantTableWithHandlers.bind(this));
-      } else {
-        await this.igvIntegration.initializeSURVIVORIGV(
-          this.createVariantTableWithHandlers.bind(this)
-        );
-      }
-
-      logger.debug(`Loading stats for ${tabId}...`);
-      await this.loadStatsForTab(tabId);
+      // Stats tables do not depend on IGV or the variant table, so load them concurrently
+      logger.debug(`Initializing IGV and loading stats for ${tabId}...`);
+      const createTable = this.createVariantTableWithHandlers.bind(this);
+      await Promise.all([
+        tabId === "bcf"
+          ? this.igvIntegration.initializeBCFIGV(createTable)
+          : this.igvIntegration.initializeSURVIVORIGV(createTable),
+        this.loadStatsForTab(tabId),
+      ]);
 
       logger.info(`Tab ${tabId} fully initialized`);
     } catch (error) {
@@ -355,13 +352,9 @@ export class ReportInitializer {
   /**
    * Create variant table with handlers
    */
-  async createVariantTableWithHandlers(prefix, variants, igvBrowser, header) {
+  async createVariantTableWithHandlers(prefix, igvBrowser, header) {
     logger.debug(`Creating table for ${prefix}`);
 
-    const metadataService = new MetadataService();
-    const fieldMetadata = metadataService.buildFieldMetadata(variants);
-    window[`${prefix}FieldMetadata`] = fieldMetadata;
-
     const plotsComponent = new VarifyPlots(this.genomeDBManager, prefix, prefix);
     window[`${prefix}Plots`] = plotsComponent;
 
@@ -5,6 +5,15 @@
  * Mirrors the Python render_stats_table() logic from html_generator.py
  */
 
+import { escapeHtml } from "../utils/HtmlUtils.js";
+
+const SURVIVOR_TITLE = "SURVIVOR Summary Table";
+const SURVIVOR_DESCRIPTION = `
+    This table summarizes structural variant types (e.g., Deletions, Duplications, Insertions, Translocations)
+    across different size ranges. It is derived from SURVIVOR's support file and shows how many variants
+    fall into each class.
+  `;
+
 /**
  * Render a single stats table with title and description
  * @param {string} title - Table title
@@ -19,34 +28,34 @@ function renderStatsTable(title, description, data) {
 
   const columns = Object.keys(data[0]);
 
-  const headerHtml = columns
-    .map((col) => `<th class="px-4 py-2 font-medium">${escapeHtml(col)}</th>`)
-    .join("");
-
-  const rowsHtml = data
-    .map((row) => {
-      const cells = columns
-        .map((col) => {
-          const value = row[col];
-          const displayValue =
-            typeof value === "number" && !Number.isInteger(value) ? value.toFixed(2) : value;
-          return `<td class="px-4 py-2">${escapeHtml(String(displayValue))}</td>`;
-        })
-        .join("");
-      return `<tr class="hover:bg-gray-50 even:bg-gray-50">${cells}</tr>`;
-    })
-    .join("");
-
-  const tableHtml = `
+  // Append every fragment to one array and join once, instead of building and
+  // joining an intermediate string per row
+  const parts = [
+    `
     <table class="min-w-full table-auto text-sm text-left text-gray-700" border="0">
       <thead class="bg-blue-600 text-white text-sm uppercase tracking-wider">
-        <tr>${headerHtml}</tr>
+        <tr>`,
+  ];
+  for (const col of columns) {
+    parts.push(`<th class="px-4 py-2 font-medium">${escapeHtml(col)}</th>`);
+  }
+  parts.push(`</tr>
       </thead>
       <tbody class="divide-y divide-gray-200">
-        ${rowsHtml}
+        `);
+  for (const row of data) {
+    parts.push('<tr class="hover:bg-gray-50 even:bg-gray-50">');
+    for (const col of columns) {
+      parts.push(`<td class="px-4 py-2">${formatCell(row[col])}</td>`);
+    }
+    parts.push("</tr>");
+  }
+  parts.push(`
       </tbody>
     </table>
-  `;
+  `);
+
+  const tableHtml = parts.join("");
 
   return `
     <div class="mb-6 mt-6 mx-4 overflow-x-auto">
@@ -95,28 +104,18 @@ export function renderSURVIVORStatsHTML(statsData) {
     return "";
   }
 
-  const title = "SURVIVOR Summary Table";
-  const description = `
-    This table summarizes structural variant types (e.g., Deletions, Duplications, Insertions, Translocations)
-    across different size ranges. It is derived from SURVIVOR's support file and shows how many variants
-    fall into each class.
-  `;
-
-  return renderStatsTable(title, description, statsData);
+  return renderStatsTable(SURVIVOR_TITLE, SURVIVOR_DESCRIPTION, statsData);
 }
 
 /**
- * Escape HTML special characters
- * @param {string} text - Text to escape
- * @returns {string} Escaped text
+ * Format a table cell value for display
+ * Numbers are emitted directly since their string form never needs escaping.
+ * @param {*} value - Cell value
+ * @returns {string} HTML-safe cell text
  */
-function escapeHtml(text) {
-  const map = {
-    "&": "&amp;",
-    "<": "&lt;",
-    ">": "&gt;",
-    '"': "&quot;",
-    "'": "&#039;",
-  };
-  return text.replace(/[&<>"']/g, (m) => map[m]);
+function formatCell(value) {
+  if (typeof value === "number") {
+    return Number.isInteger(value) ? String(value) : value.toFixed(2);
+  }
+  return escapeHtml(value);
 }
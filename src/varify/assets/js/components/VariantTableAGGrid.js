@@ -30,6 +30,16 @@ import { isMissing } from "../utils/DataValidation.js";
 const logger = new LoggerService("VariantTableAGGrid");
 const metadataService = new MetadataService();
 
+// Fields that always get a categorical filter, whatever their detected type
+const LIST_FILTER_FIELDS = new Set(["SVTYPE", "SUPP_CALLERS"]);
+
+// Set views of the priority lists for O(1) lookups when ordering the remaining columns
+const PRIORITY_COLUMNS = new Set(COLUMN_PRIORITY_ORDER);
+const PRIORITY_FORMAT_FIELDS = new Set(FORMAT_FIELD_PRIORITY);
+
+// Fields whose values differ between callers, computed once per row object
+const conflictingFieldsByRow = new WeakMap();
+
 export class VariantTableAGGrid {
   constructor(vcfParser, genomeDBManager, plotsComponent = null) {
     this.vcfParser = vcfParser;
@@ -194,7 +204,7 @@ export class VariantTableAGGrid {
     }
 
     for (const field of Object.keys(fieldMetadata)) {
-      if (!COLUMN_PRIORITY_ORDER.includes(field)) {
+      if (!PRIORITY_COLUMNS.has(field)) {
         const metadata = fieldMetadata[field];
         if (!hasData(metadata)) continue;
 
@@ -234,9 +244,7 @@ export class VariantTableAGGrid {
       return colDef;
     };
 
-    const formatPriorityOrder = FORMAT_FIELD_PRIORITY;
-
-    for (const field of formatPriorityOrder) {
+    for (const field of FORMAT_FIELD_PRIORITY) {
       const metadata = fieldMetadata[field];
       if (metadata) {
         columnDefs.push(createDetailColumn(field, metadata));
@@ -244,7 +252,7 @@ export class VariantTableAGGrid {
     }
 
     for (const field of Object.keys(fieldMetadata)) {
-      if (!formatPriorityOrder.includes(field) && field !== "caller") {
+      if (!PRIORITY_FORMAT_FIELDS.has(field) && field !== "caller") {
         if (/^[A-Z]{1,3}$/.test(field)) {
           const metadata = fieldMetadata[field];
           columnDefs.push(createDetailColumn(field, metadata));
@@ -279,7 +287,7 @@ export class VariantTableAGGrid {
     };
 
     // Special handling for SVTYPE and SUPP_CALLERS - always use categorical filter
-    if (colDef.field === "SVTYPE" || colDef.field === "SUPP_CALLERS") {
+    if (LIST_FILTER_FIELDS.has(colDef.field)) {
       const valuesArray = metadataService.getUniqueValues(metadata);
 
       if (valuesArray.length > 0) {
@@ -381,10 +389,33 @@ export class VariantTableAGGrid {
       return false;
     }
 
-    const values = rowData._allCallers.map((caller) => caller[field]);
-    const uniqueValues = new Set(values.map((v) => JSON.stringify(v)));
+    let conflictingFields = conflictingFieldsByRow.get(rowData);
+    if (!conflictingFields) {
+      conflictingFields = this.findConflictingFields(rowData._allCallers);
+      conflictingFieldsByRow.set(rowData, conflictingFields);
+    }
 
-    return uniqueValues.size > 1;
+    return conflictingFields.has(field);
+  }
+
+  // Compare callers once for every field of a row instead of once per rendered cell
+  findConflictingFields(allCallers) {
+    const fields = new Set();
+    for (const caller of allCallers) {
+      for (const field in caller) {
+        fields.add(field);
+      }
+    }
+
+    const conflictingFields = new Set();
+    for (const field of fields) {
+      const uniqueValues = new Set(allCallers.map((caller) => JSON.stringify(caller[field])));
+      if (uniqueValues.size > 1) {
+        conflictingFields.add(field);
+      }
+    }
+
+    return conflictingFields;
   }
 
   addConflictIndicator(span, params) {
@@ -665,31 +696,51 @@ export class VariantTableAGGrid {
       Object.keys(variants[0]._variant._computed).forEach((field) => computedFields.add(field));
     }
 
+    // Collect values and count present ones in the same pass over the sample.
+    // Whether a field name is internal or computed is decided once per field,
+    // not once per variant.
     const fieldValues = {};
-    variants.forEach((variant) => {
-      Object.entries(variant).forEach(([field, value]) => {
-        if (field.startsWith("_")) return;
-        if (typeof value === "object" && value !== null && !Array.isArray(value)) return;
-        if (computedFields.has(field)) return; // Skip computed fields
+    const presentCounts = {};
+    const skippedFields = new Map();
+    for (const variant of variants) {
+      for (const field in variant) {
+        let skipped = skippedFields.get(field);
+        if (skipped === undefined) {
+          skipped = field.startsWith("_") || computedFields.has(field);
+          skippedFields.set(field, skipped);
+        }
+        if (skipped) continue;
+        const value = variant[field];
+        if (typeof value === "object" && value !== null && !Array.isArray(value)) continue;
 
         if (!fieldValues[field]) {
           fieldValues[field] = [];
+          presentCounts[field] = 0;
         }
 
         fieldValues[field].push(value);
-      });
-    });
+        if (value !== null && value !== undefined && value !== "" && value !== ".") {
+          presentCounts[field]++;
+        }
+      }
+    }
 
     const metadata = {};
     Object.entries(fieldValues).forEach(([field, values]) => {
       const fieldMetadata = metadataService.analyzeField(field, values);
+      // Only low-cardinality fields get a value-list filter; skip copying and caching
+      // the unique values of string/numeric columns such as ID or POS
+      const keepUniqueValues =
+        fieldMetadata.uniqueValues.size > 0 &&
+        (fieldMetadata.type === "categorical" ||
+          fieldMetadata.type === "boolean" ||
+          LIST_FILTER_FIELDS.has(field));
       metadata[field] = {
         type: fieldMetadata.type,
-        count: values.filter((v) => v !== null && v !== undefined && v !== "" && v !== ".").length,
+        count: presentCounts[field],
         min: fieldMetadata.min,
         max: fieldMetadata.max,
-        uniqueValues:
-          fieldMetadata.uniqueValues.size > 0 ? Array.from(fieldMetadata.uniqueValues) : undefined,
+        uniqueValues: keepUniqueValues ? Array.from(fieldMetadata.uniqueValues) : undefined,
       };
     });
 
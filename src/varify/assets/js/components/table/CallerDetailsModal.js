@@ -12,6 +12,9 @@ import { LoggerService } from "../../utils/LoggerService.js";
 
 const logger = new LoggerService("CallerDetailsModal");
 
+// Per-caller keys that are shown in fixed columns or not at all
+const NON_FORMAT_KEYS = new Set(["sampleIndex", "sampleName", "caller", "ID"]);
+
 export class CallerDetailsModal {
   /**
    * Show modal with caller details
@@ -155,7 +158,7 @@ export class CallerDetailsModal {
     const formatFields = new Set();
     allCallers.forEach((caller) => {
       Object.keys(caller).forEach((key) => {
-        if (!["sampleIndex", "sampleName", "caller", "ID"].includes(key)) {
+        if (!NON_FORMAT_KEYS.has(key)) {
           formatFields.add(key);
         }
       });
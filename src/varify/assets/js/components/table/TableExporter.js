@@ -10,6 +10,22 @@ import { LoggerService } from "../../utils/LoggerService.js";
 
 const logger = new LoggerService("TableExporter");
 
+// Row keys written to fixed VCF columns (or not at all) when rebuilding INFO from a table row
+const NON_INFO_KEYS = new Set([
+  "CHROM",
+  "POS",
+  "ID",
+  "REF",
+  "ALT",
+  "QUAL",
+  "FILTER",
+  "_variant",
+  "locus",
+]);
+
+// Values containing a delimiter or quote must be quoted in CSV output
+const CSV_QUOTE_PATTERN = /[",]/;
+
 export class TableExporter {
   constructor(gridApi) {
     this.gridApi = gridApi;
@@ -37,7 +53,7 @@ export class TableExporter {
     selectedRows.forEach((row) => {
       const values = columns.map((col) => {
         let value = row[col];
-        if (typeof value === "string" && (value.includes(",") || value.includes('"'))) {
+        if (typeof value === "string" && CSV_QUOTE_PATTERN.test(value)) {
           value = `"${value.replace(/"/g, '""')}"`;
         }
         return value ?? "";
@@ -79,12 +95,7 @@ export class TableExporter {
         logger.warn("Original variant not found in row, reconstructing");
         const infoFields = [];
         for (const [key, value] of Object.entries(row)) {
-          if (
-            !["CHROM", "POS", "ID", "REF", "ALT", "QUAL", "FILTER", "_variant", "locus"].includes(
-              key
-            ) &&
-            !key.startsWith("_")
-          ) {
+          if (!NON_INFO_KEYS.has(key) && !key.startsWith("_")) {
             if (typeof value === "boolean" && value) {
               infoFields.push(key);
             } else if (value !== null && value !== undefined) {
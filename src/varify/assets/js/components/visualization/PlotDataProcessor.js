@@ -11,7 +11,7 @@
  */
 
 import { quantiles, countBy, groupBy, gaussianKDE } from "../../utils/StatisticsUtils.js";
-import { isMissing, isNumeric } from "../../utils/DataValidation.js";
+import { isMissing, isNumeric, parseSuppCallers } from "../../utils/DataValidation.js";
 import { PLOT_DEFAULTS } from "../../config/plots.js";
 
 export class PlotDataProcessor {
@@ -31,10 +31,7 @@ export class PlotDataProcessor {
 
       if (!callersString) continue;
 
-      const callers = String(callersString)
-        .split(",")
-        .map((c) => c.trim())
-        .filter((c) => c.length > 0);
+      const callers = parseSuppCallers(String(callersString));
 
       for (const caller of callers) {
         exploded.push({
@@ -57,12 +54,7 @@ export class PlotDataProcessor {
   static extractCallersWithDuplicates(callersString) {
     if (!callersString) return [];
 
-    const callers = String(callersString)
-      .split(",")
-      .map((c) => c.trim())
-      .filter((c) => c.length > 0);
-
-    return callers;
+    return parseSuppCallers(String(callersString));
   }
 
   /**
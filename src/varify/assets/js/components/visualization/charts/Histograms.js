@@ -107,12 +107,19 @@ export function renderSizeDistribution(variants, echarts, container, eventBus) {
     binEdges: nonEmptyIndices.map((i) => histDataRaw.binEdges[i]),
   };
 
-  const smallVariants = filtered.filter((v) => Math.abs(v.SVLEN) < 1000).length;
-  const mediumVariants = filtered.filter((v) => {
-    const len = Math.abs(v.SVLEN);
-    return len >= 1000 && len < 10000;
-  }).length;
-  const largeVariants = filtered.filter((v) => Math.abs(v.SVLEN) >= 10000).length;
+  // Bucket the absolute lengths computed above in one pass
+  let smallVariants = 0;
+  let mediumVariants = 0;
+  let largeVariants = 0;
+  for (const len of svlenValues) {
+    if (len < 1000) {
+      smallVariants++;
+    } else if (len < 10000) {
+      mediumVariants++;
+    } else if (len >= 10000) {
+      largeVariants++;
+    }
+  }
 
   const smallPct = ((smallVariants / filtered.length) * 100).toFixed(1);
   const mediumPct = ((mediumVariants / filtered.length) * 100).toFixed(1);
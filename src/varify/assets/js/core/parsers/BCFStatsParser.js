@@ -5,22 +5,168 @@
  * Mirrors the Python logic from stats_parser.py::parse_bcftools_stats()
  */
 
+/**
+ * Column layout of each rendered bcftools stats section.
+ * `numeric` columns are parsed as numbers, everything else is kept as text.
+ * `nonZero` lists the columns of which at least one must be non-zero for a row to be kept.
+ */
+const SECTION_SCHEMAS = {
+  SN: {
+    columns: ["id", "key", "value"],
+    numeric: ["value"],
+    nonZero: ["value"],
+  },
+  TSTV: {
+    columns: ["id", "ts", "tv", "ts/tv", "ts (1st ALT)", "tv (1st ALT)", "ts/tv (1st ALT)"],
+    numeric: ["ts", "tv", "ts (1st ALT)", "tv (1st ALT)"],
+    nonZero: ["ts", "tv", "ts (1st ALT)", "tv (1st ALT)"],
+  },
+  SiS: {
+    columns: [
+      "id",
+      "allele count",
+      "number of SNPs",
+      "number of transitions",
+      "number of transversions",
+      "number of indels",
+      "repeat-consistent",
+      "repeat-inconsistent",
+      "not applicable",
+    ],
+    numeric: [
+      "number of SNPs",
+      "number of transitions",
+      "number of transversions",
+      "number of indels",
+      "repeat-consistent",
+      "repeat-inconsistent",
+      "not applicable",
+    ],
+    nonZero: [
+      "number of SNPs",
+      "number of transitions",
+      "number of transversions",
+      "number of indels",
+    ],
+  },
+  AF: {
+    columns: [
+      "id",
+      "allele frequency",
+      "number of SNPs",
+      "number of transitions",
+      "number of transversions",
+      "number of indels",
+      "repeat-consistent",
+      "repeat-inconsistent",
+      "not applicable",
+    ],
+    numeric: [
+      "number of SNPs",
+      "number of transitions",
+      "number of transversions",
+      "number of indels",
+      "repeat-consistent",
+      "repeat-inconsistent",
+      "not applicable",
+    ],
+    nonZero: [
+      "number of SNPs",
+      "number of transitions",
+      "number of transversions",
+      "number of indels",
+    ],
+  },
+  QUAL: {
+    columns: [
+      "id",
+      "Quality",
+      "number of SNPs",
+      "number of transitions (1st ALT)",
+      "number of transversions (1st ALT)",
+      "number of indels",
+    ],
+    numeric: [
+      "number of SNPs",
+      "number of transitions (1st ALT)",
+      "number of transversions (1st ALT)",
+      "number of indels",
+    ],
+    nonZero: [
+      "number of SNPs",
+      "number of transitions (1st ALT)",
+      "number of transversions (1st ALT)",
+      "number of indels",
+    ],
+  },
+  IDD: {
+    columns: [
+      "id",
+      "length (deletions negative)",
+      "number of sites",
+      "number of genotypes",
+      "mean VAF",
+    ],
+    numeric: ["number of sites", "number of genotypes", "mean VAF"],
+    nonZero: ["number of sites", "number of genotypes", "mean VAF"],
+  },
+  ST: {
+    columns: ["id", "type", "count"],
+    numeric: ["count"],
+    nonZero: ["count"],
+  },
+  DP: {
+    columns: [
+      "id",
+      "bin",
+      "number of genotypes",
+      "fraction of genotypes (%)",
+      "number of sites",
+      "fraction of sites (%)",
+    ],
+    numeric: [
+      "number of genotypes",
+      "fraction of genotypes (%)",
+      "number of sites",
+      "fraction of sites (%)",
+    ],
+    nonZero: [
+      "number of genotypes",
+      "fraction of genotypes (%)",
+      "number of sites",
+      "fraction of sites (%)",
+    ],
+  },
+};
+
+/**
+ * Resolve column names of each schema to field positions once, so rows are
+ * filtered and built straight from the split line.
+ */
+const SECTION_LAYOUTS = Object.fromEntries(
+  Object.entries(SECTION_SCHEMAS).map(([section, schema]) => [
+    section,
+    {
+      columns: schema.columns.map((name, index) => ({
+        name,
+        index,
+        numeric: schema.numeric.includes(name),
+      })),
+      nonZero: schema.nonZero.map((name) => schema.columns.indexOf(name)),
+    },
+  ])
+);
+
 /**
  * Parse bcftools stats text file
  * @param {string} fileContent - Raw text content of bcftools stats file
  * @returns {Object} Dictionary mapping section names (SN, TSTV, etc.) to arrays of objects
  */
 export function parseBCFToolsStats(fileContent) {
-  const sections = {
-    SN: [],
-    TSTV: [],
-    SiS: [],
-    AF: [],
-    QUAL: [],
-    IDD: [],
-    ST: [],
-    DP: [],
-  };
+  const sections = {};
+  for (const section of Object.keys(SECTION_LAYOUTS)) {
+    sections[section] = [];
+  }
 
   const lines = fileContent.split("\n");
 
@@ -34,170 +180,30 @@ export function parseBCFToolsStats(fileContent) {
       continue;
     }
 
-    const section = parts[0];
-
-    if (section in sections) {
-      sections[section].push(parts.slice(1));
-    }
-  }
-
-  const dataframes = {};
-
-  if (sections.SN.length > 0) {
-    const data = sections.SN.map((row) => ({
-      id: row[0],
-      key: row[1],
-      value: parseFloat(row[2]) || 0,
-    }));
-
-    const nonZero = data.filter((row) => row.value !== 0);
-    if (nonZero.length > 0) {
-      dataframes.SN = nonZero;
-    }
-  }
-
-  if (sections.TSTV.length > 0) {
-    const data = sections.TSTV.map((row) => ({
-      id: row[0],
-      ts: parseFloat(row[1]) || 0,
-      tv: parseFloat(row[2]) || 0,
-      "ts/tv": row[3],
-      "ts (1st ALT)": parseFloat(row[4]) || 0,
-      "tv (1st ALT)": parseFloat(row[5]) || 0,
-      "ts/tv (1st ALT)": row[6],
-    }));
-
-    const nonZero = data.filter(
-      (row) =>
-        row.ts !== 0 || row.tv !== 0 || row["ts (1st ALT)"] !== 0 || row["tv (1st ALT)"] !== 0
-    );
-    if (nonZero.length > 0) {
-      dataframes.TSTV = nonZero;
-    }
-  }
-
-  if (sections.SiS.length > 0) {
-    const data = sections.SiS.map((row) => ({
-      id: row[0],
-      "allele count": row[1],
-      "number of SNPs": parseFloat(row[2]) || 0,
-      "number of transitions": parseFloat(row[3]) || 0,
-      "number of transversions": parseFloat(row[4]) || 0,
-      "number of indels": parseFloat(row[5]) || 0,
-      "repeat-consistent": parseFloat(row[6]) || 0,
-      "repeat-inconsistent": parseFloat(row[7]) || 0,
-      "not applicable": parseFloat(row[8]) || 0,
-    }));
-
-    const nonZero = data.filter(
-      (row) =>
-        row["number of SNPs"] !== 0 ||
-        row["number of transitions"] !== 0 ||
-        row["number of transversions"] !== 0 ||
-        row["number of indels"] !== 0
-    );
-    if (nonZero.length > 0) {
-      dataframes.SiS = nonZero;
-    }
-  }
-
-  if (sections.AF.length > 0) {
-    const data = sections.AF.map((row) => ({
-      id: row[0],
-      "allele frequency": row[1],
-      "number of SNPs": parseFloat(row[2]) || 0,
-      "number of transitions": parseFloat(row[3]) || 0,
-      "number of transversions": parseFloat(row[4]) || 0,
-      "number of indels": parseFloat(row[5]) || 0,
-      "repeat-consistent": parseFloat(row[6]) || 0,
-      "repeat-inconsistent": parseFloat(row[7]) || 0,
-      "not applicable": parseFloat(row[8]) || 0,
-    }));
-
-    const nonZero = data.filter(
-      (row) =>
-        row["number of SNPs"] !== 0 ||
-        row["number of transitions"] !== 0 ||
-        row["number of transversions"] !== 0 ||
-        row["number of indels"] !== 0
-    );
-    if (nonZero.length > 0) {
-      dataframes.AF = nonZero;
-    }
-  }
-
-  if (sections.QUAL.length > 0) {
-    const data = sections.QUAL.map((row) => ({
-      id: row[0],
-      Quality: row[1],
-      "number of SNPs": parseFloat(row[2]) || 0,
-      "number of transitions (1st ALT)": parseFloat(row[3]) || 0,
-      "number of transversions (1st ALT)": parseFloat(row[4]) || 0,
-      "number of indels": parseFloat(row[5]) || 0,
-    }));
-
-    const nonZero = data.filter(
-      (row) =>
-        row["number of SNPs"] !== 0 ||
-        row["number of transitions (1st ALT)"] !== 0 ||
-        row["number of transversions (1st ALT)"] !== 0 ||
-        row["number of indels"] !== 0
-    );
-    if (nonZero.length > 0) {
-      dataframes.QUAL = nonZero;
+    const layout = SECTION_LAYOUTS[parts[0]];
+    if (!layout) {
+      continue;
     }
-  }
-
-  if (sections.IDD.length > 0) {
-    const data = sections.IDD.map((row) => ({
-      id: row[0],
-      "length (deletions negative)": row[1],
-      "number of sites": parseFloat(row[2]) || 0,
-      "number of genotypes": parseFloat(row[3]) || 0,
-      "mean VAF": parseFloat(row[4]) || 0,
-    }));
 
-    const nonZero = data.filter(
-      (row) =>
-        row["number of sites"] !== 0 || row["number of genotypes"] !== 0 || row["mean VAF"] !== 0
-    );
-    if (nonZero.length > 0) {
-      dataframes.IDD = nonZero;
+    // Drop all-zero rows before building the row object
+    const fields = parts.slice(1);
+    if (!layout.nonZero.some((index) => parseFloat(fields[index]) || 0)) {
+      continue;
     }
-  }
 
-  if (sections.ST.length > 0) {
-    const data = sections.ST.map((row) => ({
-      id: row[0],
-      type: row[1],
-      count: parseFloat(row[2]) || 0,
-    }));
-
-    const nonZero = data.filter((row) => row.count !== 0);
-    if (nonZero.length > 0) {
-      dataframes.ST = nonZero;
+    const row = {};
+    for (const column of layout.columns) {
+      const value = fields[column.index];
+      row[column.name] = column.numeric ? parseFloat(value) || 0 : value;
     }
+    sections[parts[0]].push(row);
   }
 
-  if (sections.DP.length > 0) {
-    const data = sections.DP.map((row) => ({
-      id: row[0],
-      bin: row[1],
-      "number of genotypes": parseFloat(row[2]) || 0,
-      "fraction of genotypes (%)": parseFloat(row[3]) || 0,
-      "number of sites": parseFloat(row[4]) || 0,
-      "fraction of sites (%)": parseFloat(row[5]) || 0,
-    }));
+  const dataframes = {};
 
-    const nonZero = data.filter(
-      (row) =>
-        row["number of genotypes"] !== 0 ||
-        row["fraction of genotypes (%)"] !== 0 ||
-        row["number of sites"] !== 0 ||
-        row["fraction of sites (%)"] !== 0
-    );
-    if (nonZero.length > 0) {
-      dataframes.DP = nonZero;
+  for (const [section, rows] of Object.entries(sections)) {
+    if (rows.length > 0) {
+      dataframes[section] = rows;
     }
   }
 
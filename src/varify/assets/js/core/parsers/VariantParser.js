@@ -94,9 +94,8 @@ export class VariantParser {
     if (end) {
       return `${chrom}:${pos}-${end}`;
     } else {
-      const start = Math.max(1, parseInt(pos) - 1000);
-      const endPos = parseInt(pos) + 1000;
-      return `${chrom}:${start}-${endPos}`;
+      const position = parseInt(pos);
+      return `${chrom}:${Math.max(1, position - 1000)}-${position + 1000}`;
     }
   }
 
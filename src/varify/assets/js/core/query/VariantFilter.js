@@ -9,6 +9,18 @@
 
 import { isMissing, parseNumericValue, parseSuppCallers } from "../../utils/DataValidation.js";
 
+// Set views of categorical filter value lists, built once per filter instead of once per variant
+const valueSets = new WeakMap();
+
+function getValueSet(values) {
+  let valueSet = valueSets.get(values);
+  if (!valueSet) {
+    valueSet = new Set(values);
+    valueSets.set(values, valueSet);
+  }
+  return valueSet;
+}
+
 export class VariantFilter {
   /**
    * Check if object store has an index
@@ -94,7 +106,8 @@ export class VariantFilter {
    * @returns {boolean}
    */
   static matchesFilters(variant, filters, multiCallerMode = false) {
-    for (const [field, filter] of Object.entries(filters)) {
+    for (const field in filters) {
+      const filter = filters[field];
       const value = variant[field];
 
       // For SURVIVOR variants with _allCallers in multi-caller mode, check if ANY caller matches
@@ -131,16 +144,17 @@ export class VariantFilter {
       // Standard filtering (INFO fields or PRIMARY caller when not multi-caller mode)
       if (typeof filter === "object" && filter.values !== undefined) {
         // Special handling for SUPP_CALLERS - check if any selected caller is in the comma-separated string
+        const selected = getValueSet(filter.values);
         if (field === "SUPP_CALLERS" && typeof value === "string") {
           const callers = parseSuppCallers(value);
-          const hasMatch = filter.values.some((selectedCaller) => callers.includes(selectedCaller));
+          const hasMatch = callers.some((caller) => selected.has(caller));
           if (!hasMatch) {
             return false;
           }
           continue;
         }
 
-        if (!filter.values.includes(value)) {
+        if (!selected.has(value)) {
           return false;
         }
         continue;
@@ -193,7 +207,7 @@ export class VariantFilter {
       const value = caller[field];
 
       if (typeof filter === "object" && filter.values !== undefined) {
-        if (filter.values.includes(value)) {
+        if (getValueSet(filter.values).has(value)) {
           return true;
         }
         continue;
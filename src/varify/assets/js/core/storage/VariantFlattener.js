@@ -48,14 +48,11 @@ export class VariantFlattener {
           if (key === "ID") continue;
 
           if (typeof value === "string" && value !== "." && value !== "") {
-            if (value.includes(",")) {
-              const firstValue = value.split(",")[0].trim();
-              const num = parseFloat(firstValue);
-              flattened[key] = isNaN(num) || firstValue !== String(num) ? firstValue : num;
-            } else {
-              const num = parseFloat(value);
-              flattened[key] = isNaN(num) || value !== String(num) ? value : num;
-            }
+            // Multi-value fields keep their first value; slice it out instead of splitting them all
+            const comma = value.indexOf(",");
+            const text = comma === -1 ? value : value.slice(0, comma).trim();
+            const num = parseFloat(text);
+            flattened[key] = isNaN(num) || text !== String(num) ? text : num;
           } else {
             flattened[key] = value;
           }
@@ -41,6 +41,20 @@ export class MetadataService {
     let hasNonNumeric = false;
 
     const numericValues = [];
+    // Numbers from comma-separated values, collected while detecting them
+    const listNumbers = [];
+    const collectListNumbers = (value) => {
+      let allPartsNumeric = true;
+      for (const part of value.split(",")) {
+        const num = parseNumericValue(part.trim());
+        if (num !== null) {
+          listNumbers.push(num);
+        } else {
+          allPartsNumeric = false;
+        }
+      }
+      return allPartsNumeric;
+    };
 
     for (const value of values) {
       if (isMissing(value)) {
@@ -53,15 +67,16 @@ export class MetadataService {
         stats.hasMultiple = true;
         const callers = parseSuppCallers(value);
         callers.forEach((caller) => stats.uniqueValues.add(caller));
+        if (value.includes(",")) {
+          collectListNumbers(value);
+        }
         hasNonNumeric = true;
         continue;
       }
 
       if (typeof value === "string" && value.includes(",")) {
         stats.hasMultiple = true;
-        const parts = value.split(",");
-        const allPartsNumeric = parts.every((part) => parseNumericValue(part.trim()) !== null);
-        if (allPartsNumeric) {
+        if (collectListNumbers(value)) {
           hasNumeric = true;
         } else {
           hasNonNumeric = true;
@@ -99,23 +114,12 @@ export class MetadataService {
       stats.type = "string";
     }
 
-    if (stats.hasMultiple && hasNumeric) {
-      const allNumbers = [];
-      values.forEach((v) => {
-        if (v && typeof v === "string" && v.includes(",")) {
-          v.split(",").forEach((part) => {
-            const num = parseNumericValue(part.trim());
-            if (num !== null) allNumbers.push(num);
-          });
-        }
-      });
-      if (allNumbers.length > 0) {
-        stats.min = allNumbers[0];
-        stats.max = allNumbers[0];
-        for (let i = 1; i < allNumbers.length; i++) {
-          if (allNumbers[i] < stats.min) stats.min = allNumbers[i];
-          if (allNumbers[i] > stats.max) stats.max = allNumbers[i];
-        }
+    if (stats.hasMultiple && hasNumeric && listNumbers.length > 0) {
+      stats.min = listNumbers[0];
+      stats.max = listNumbers[0];
+      for (let i = 1; i < listNumbers.length; i++) {
+        if (listNumbers[i] < stats.min) stats.min = listNumbers[i];
+        if (listNumbers[i] > stats.max) stats.max = listNumbers[i];
       }
     }
 
@@ -234,17 +238,7 @@ export class MetadataService {
 
       const value = primarySample[fieldKey];
 
-      if (
-        value !== null &&
-        value !== undefined &&
-        value !== "." &&
-        value !== "" &&
-        !(typeof value === "string" && value.toUpperCase() === "NAN")
-      ) {
-        values.push(value);
-      } else {
-        values.push(null);
-      }
+      values.push(isMissing(value) ? null : value);
     }
 
     return values;
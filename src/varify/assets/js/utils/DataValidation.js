@@ -27,7 +27,8 @@ export function isMissing(value) {
     value === undefined ||
     value === "." ||
     value === "" ||
-    (typeof value === "string" && value.toUpperCase() === "NAN")
+    // Check the length first so ordinary strings are not upper-cased on every call
+    (typeof value === "string" && value.length === 3 && value.toUpperCase() === "NAN")
   );
 }
 
@@ -148,8 +149,13 @@ export function parseSuppCallers(suppCallersValue) {
     return [];
   }
 
-  return suppCallersValue
-    .split(",")
-    .map((c) => c.trim())
-    .filter((c) => c.length > 0);
+  // Trim and drop empty entries in one pass instead of map + filter
+  const callers = [];
+  for (const part of suppCallersValue.split(",")) {
+    const caller = part.trim();
+    if (caller.length > 0) {
+      callers.push(caller);
+    }
+  }
+  return callers;
 }
@@ -0,0 +1,29 @@
+/**
+ * HTML Utilities
+ *
+ * Shared helpers for building HTML strings in components.
+ */
+
+const HTML_ESCAPES = {
+  "&": "&amp;",
+  "<": "&lt;",
+  ">": "&gt;",
+  '"': "&quot;",
+  "'": "&#039;",
+};
+
+/**
+ * Escape HTML special characters
+ * Quotes are escaped too, so the result is safe inside attribute values.
+ *
+ * @param {*} text - Text to escape (non-strings are converted with String())
+ * @returns {string} - Escaped text
+ *
+ * @example
+ * escapeHtml("<b>")          // "&lt;b&gt;"
+ * escapeHtml('a "b" & c')    // "a &quot;b&quot; &amp; c"
+ * escapeHtml(42)             // "42"
+ */
+export function escapeHtml(text) {
+  return String(text).replace(/[&<>"']/g, (m) => HTML_ESCAPES[m]);
+}
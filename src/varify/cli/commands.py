@@ -4,14 +4,35 @@ CLI commands for Varify.
 
 import argparse
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from ..core import VcfProcessor, VcfType
-from ..reporting.html_generator import generate_combined_report
+# Parsing and reporting modules pull in pandas, vcfpy and pysam, so they are
+# imported where they are used to keep `varify --help` fast.
+if TYPE_CHECKING:
+    from ..core import VcfType
 
 
-def parse_args() -> argparse.Namespace:
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command-line arguments for Varify."""
-    parser = argparse.ArgumentParser(description="Generate structural variant reports.")
+    parser = argparse.ArgumentParser(
+        prog="varify",
+        description="Generate structural variant reports.",
+        epilog="Batch runs: `varify serve` starts a preloaded daemon and "
+        "`varify submit -- <arguments>` runs a report on it.",
+    )
 
     parser.add_argument("--output-dir", required=False, default="out/", help="Output directory")
     parser.add_argument("--bcf-vcf-file", required=False, help="BCF merged VCF")
@@ -30,41 +51,124 @@ def parse_args() -> argparse.Namespace:
         help="Filename for the combined HTML report (saved in output_dir)",
     )
     parser.add_argument("--profile", default="default", help="Profile run from the pipeline")
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=None,
+        help="Number of VCF records parsed per DataFrame chunk (default: parser default)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="Worker processes for per-contig parsing of bgzipped, tabix-indexed VCFs, "
+        "split between the BCF and SURVIVOR inputs",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse parsed VCFs cached in output_dir by earlier --cache runs. "
+        "The cache is stored as pickles, so only use it with output directories you trust",
+    )
+
+    return parser.parse_args(argv)
 
-    return parser.parse_args()
 
+def _process_one(
+    vcf_type: "VcfType",
+    vcf_path: str,
+    output_dir: str,
+    stats_file: Optional[str],
+    chunk_size: int,
+    use_cache: bool,
+    n_workers: int,
+) -> Tuple[Optional[dict], Optional[str]]:
+    """Process a single VCF and reduce it to its report summary.
 
-def main() -> None:
+    Kept at module level so it can be pickled into a worker process. Only the
+    summary is returned, so the parsed DataFrame never crosses the process boundary.
+
+    Returns:
+        Tuple of (summary, enriched_vcf_path)
+    """
+    from ..core import VcfProcessor
+    from ..reporting.html_generator import summarize_sv
+
+    processor = VcfProcessor(vcf_type, vcf_path, output_dir, use_cache=use_cache)
+    df, _, _, enriched_vcf = processor.process(
+        stats_file, chunk_size=chunk_size, n_workers=n_workers
+    )
+    return summarize_sv(df), enriched_vcf
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """Main entry point for Varify CLI."""
-    args = parse_args()
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] in (["serve"], ["submit"]):
+        from .serve import serve_main
 
-    print("\n--- Starting Report Generation ---\n")
+        serve_main(argv)
+        return
 
-    # Initialize defaults
-    bcf_df, bcf_enriched_vcf = None, None
-    survivor_df, survivor_enriched_vcf = None, None
+    args = parse_args(argv)
 
-    # Process BCF VCF file
-    if args.bcf_vcf_file:
-        processor = VcfProcessor(VcfType.BCF, args.bcf_vcf_file, args.output_dir)
-        bcf_df, _, _, bcf_enriched_vcf = processor.process(args.bcf_stats_file)
+    from ..core import VcfType
+    from ..core.vcf_parser import DEFAULT_CHUNK_SIZE
+    from ..reporting.html_generator import generate_combined_report
 
-    # Process SURVIVOR VCF file
+    print("\n--- Starting Report Generation ---\n")
+
+    chunk_size = args.chunk_size or DEFAULT_CHUNK_SIZE
+    use_cache = args.cache
+    # BCF and SURVIVOR are parsed at the same time, so they share the --workers budget
+    n_inputs = sum(1 for path in (args.bcf_vcf_file, args.survivor_vcf_file) if path)
+    n_workers = max(1, args.workers // max(1, n_inputs))
+    jobs = {}
+    if args.bcf_vcf_file:
+        jobs[VcfType.BCF] = (
+            VcfType.BCF,
+            args.bcf_vcf_file,
+            args.output_dir,
+            args.bcf_stats_file,
+            chunk_size,
+            use_cache,
+            n_workers,
+        )
     if args.survivor_vcf_file:
-        processor = VcfProcessor(VcfType.SURVIVOR, args.survivor_vcf_file, args.output_dir)
-        survivor_df, _, _, survivor_enriched_vcf = processor.process(args.survivor_stats_file)
+        jobs[VcfType.SURVIVOR] = (
+            VcfType.SURVIVOR,
+            args.survivor_vcf_file,
+            args.output_dir,
+            args.survivor_stats_file,
+            chunk_size,
+            use_cache,
+            n_workers,
+        )
+
+    # BCF and SURVIVOR inputs are independent, so parse them in separate processes
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {t: executor.submit(_process_one, *job) for t, job in jobs.items()}
+            results = {t: future.result() for t, future in futures.items()}
+    else:
+        results = {t: _process_one(*job) for t, job in jobs.items()}
+
+    bcf_summary, bcf_enriched_vcf = results.get(VcfType.BCF, (None, None))
+    survivor_summary, survivor_enriched_vcf = results.get(VcfType.SURVIVOR, (None, None))
 
     generate_combined_report(
         combined_report_file=os.path.join(args.output_dir, args.report_file),
         bcf_vcf_path=bcf_enriched_vcf or args.bcf_vcf_file,
         survivor_vcf_path=survivor_enriched_vcf or args.survivor_vcf_file,
         fasta_path=args.fasta_file,
-        bcf_df=bcf_df,
-        survivor_df=survivor_df,
+        bcf_df=None,
+        survivor_df=None,
         profiles=args.profile,
         reference_name=args.fasta_file,
         bcf_stats_file=args.bcf_stats_file,
         survivor_stats_file=args.survivor_stats_file,
+        bcf_summary=bcf_summary,
+        survivor_summary=survivor_summary,
     )
 
     print("\n--- Report Generation Complete ---\n")
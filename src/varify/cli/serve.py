@@ -0,0 +1,250 @@
+"""
+Batch daemon for Varify.
+
+`varify serve` keeps one process alive with the parsing and reporting stack
+(pandas, vcfpy, pysam) imported and the report shell cached. `varify submit`
+sends a regular varify command line to it over a Unix socket.
+
+Each job runs in a child forked from the daemon, so it starts with everything
+preloaded and cannot leak state into later jobs. The child's stdout and stderr
+are redirected to the socket, so the client sees the same output as a direct run.
+
+Memory trade-off: the daemon holds the imported modules and the inlined report
+shell (the size of the JS/CSS bundles) for as long as it runs. Each job's
+memory is released when its child exits.
+"""
+
+import argparse
+import contextlib
+import errno
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import traceback
+from typing import List, Optional
+
+EXIT_MARKER = b"\0varify-exit:"
+
+
+def default_socket_path() -> str:
+    """Per-user socket path, preferring XDG_RUNTIME_DIR."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"varify-{os.getuid()}.sock")
+
+
+class _ForkingUnixServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server that handles every job in a forked child."""
+
+    def process_request(self, request, client_address) -> None:
+        # The shutdown handler raises SystemExit, and an exception raised while fork()
+        # runs its at-fork hooks is discarded, so hold SIGTERM until the fork is done
+        old_mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+        try:
+            super().process_request(request, client_address)
+        finally:
+            signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    """Runs one varify command line sent by `varify submit`."""
+
+    def handle(self) -> None:
+        from .commands import main
+
+        # Jobs are killed normally; only the daemon turns SIGTERM into a clean shutdown
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+
+        line = self.rfile.readline()
+        if not line:
+            # Connection closed without a request, e.g. a liveness probe from `varify serve`
+            return
+
+        exit_code = 0
+        try:
+            request = json.loads(line)
+            os.chdir(request["cwd"])
+
+            # Send everything the job prints, including worker processes, to the client
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(self.connection.fileno(), 1)
+            os.dup2(self.connection.fileno(), 2)
+
+            argv = request["argv"]
+            if argv[:1] in (["serve"], ["submit"]):
+                # A job running serve() would replace this daemon's socket from the child
+                print(f"ERROR: '{argv[0]}' cannot be run as a daemon job", file=sys.stderr)
+                exit_code = 2
+            else:
+                main(argv)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.stderr.write(traceback.format_exc())
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+        self.wfile.write(EXIT_MARKER + str(exit_code).encode() + b"\n")
+
+
+def _preload() -> None:
+    """Import the heavy modules and warm the report shell cache before forking jobs."""
+    from ..core import VcfProcessor  # noqa: F401
+    from ..reporting.html_generator import get_package_resource, load_report_shell
+
+    try:
+        load_report_shell(
+            get_package_resource("templates/report-template.html"),
+            get_package_resource("dist/bundle.js"),
+            get_package_resource("dist/bundle.css"),
+        )
+    except FileNotFoundError:
+        # Reported per job by generate_combined_report
+        pass
+
+
+def _daemon_listening(socket_path: str) -> bool:
+    """Check whether a daemon is accepting connections on socket_path.
+
+    Returns:
+        True if a connection succeeds, False if the socket is stale or gone
+
+    Raises:
+        OSError: If the path cannot be probed for any other reason, e.g. it is
+            not a socket or is not accessible
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError as e:
+            if e.errno in (errno.ECONNREFUSED, errno.ENOENT):
+                return False
+            raise
+    return True
+
+
+def serve(socket_path: str) -> None:
+    """Run the daemon until interrupted.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on
+    """
+    if os.path.exists(socket_path):
+        if _daemon_listening(socket_path):
+            sys.exit(f"ERROR: Varify daemon already running on {socket_path}")
+        # Left behind by a daemon that did not shut down cleanly
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+
+    _preload()
+
+    # Installed before binding, so a SIGTERM as soon as clients can connect still cleans up
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    # Only the current user may connect
+    old_umask = os.umask(0o077)
+    try:
+        server = _ForkingUnixServer(socket_path, _JobHandler)
+    finally:
+        os.umask(old_umask)
+
+    try:
+        with server:
+            print(f"Varify daemon listening on {socket_path}")
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def submit(argv: List[str], socket_path: str) -> int:
+    """Run a varify command line on the daemon and stream its output.
+
+    Args:
+        argv: Arguments as they would be passed to `varify`
+        socket_path: Path of the daemon's Unix socket
+
+    Returns:
+        Exit code of the job
+    """
+    request = json.dumps({"argv": argv, "cwd": os.getcwd()}).encode("utf-8") + b"\n"
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(request)
+
+        out = sys.stdout.buffer
+        pending = b""
+        # Bytes after the exit marker; None until the marker has been seen
+        exit_status = None
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                break
+            if exit_status is not None:
+                exit_status += data
+            else:
+                pending += data
+                marker = pending.find(EXIT_MARKER)
+                if marker == -1:
+                    # Keep a tail that may hold the start of a marker split across reads
+                    keep = len(EXIT_MARKER) - 1
+                    out.write(pending[:-keep])
+                    out.flush()
+                    pending = pending[-keep:]
+                    continue
+                out.write(pending[:marker])
+                out.flush()
+                exit_status = pending[marker + len(EXIT_MARKER) :]
+            # The exit code may arrive in later reads; it is complete at its newline
+            if b"\n" in exit_status:
+                break
+
+    if exit_status is None:
+        out.write(pending)
+        out.flush()
+        print("ERROR: Varify daemon closed the connection before the job finished", file=sys.stderr)
+        return 1
+
+    code = exit_status.split(b"\n", 1)[0]
+    try:
+        return int(code)
+    except ValueError:
+        print(f"ERROR: Varify daemon sent an invalid exit code: {code!r}", file=sys.stderr)
+        return 1
+
+
+def serve_main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for `varify serve` and `varify submit`."""
+    parser = argparse.ArgumentParser(
+        prog="varify", description="Run Varify jobs through a preloaded daemon."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Start the daemon")
+    serve_parser.add_argument("--socket", default=default_socket_path(), help="Unix socket path")
+
+    submit_parser = subparsers.add_parser(
+        "submit", help="Run a varify command on the daemon, e.g. varify submit -- --fasta-file ..."
+    )
+    submit_parser.add_argument("--socket", default=default_socket_path(), help="Unix socket path")
+    submit_parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for varify")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket)
+        return
+
+    job_args = args.args[1:] if args.args[:1] == ["--"] else args.args
+    sys.exit(submit(job_args, args.socket))
@@ -1,10 +1,11 @@
 from .callers.base import AbstractVariantCaller
-from .vcf_parser import VcfType, parse_vcf, write_enriched_vcf
+from .vcf_parser import VcfType, parse_vcf, parse_vcf_parallel, write_enriched_vcf
 from .vcf_processor import VcfProcessor
 
 __all__ = [
     "VcfType",
     "parse_vcf",
+    "parse_vcf_parallel",
     "write_enriched_vcf",
     "VcfProcessor",
     "AbstractVariantCaller",
@@ -11,8 +11,12 @@ These are minimal, caller-agnostic transformations.
 
 from typing import Any, Dict, Optional
 
+import pandas as pd
 import vcfpy
 
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ("CHROM", "SVTYPE", "FILTER", "PRIMARY_CALLER", "SUPP_CALLERS")
+
 
 class GeneralProcessor:
     """Applies universal normalizations to VCF records."""
@@ -106,3 +110,23 @@ class GeneralProcessor:
             return False
 
         return True
+
+    @staticmethod
+    def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """Store low-cardinality string columns as categoricals.
+
+        CHROM, SVTYPE, FILTER and the caller columns repeat a handful of values
+        across all records, so categorical codes are much smaller than one Python
+        string per row and make unique/count reductions on them cheap.
+
+        Args:
+            df: DataFrame with parsed VCF data
+
+        Returns:
+            DataFrame with the CATEGORICAL_COLUMNS present stored as categoricals
+        """
+        if df is None or df.empty:
+            return df
+
+        columns = [col for col in CATEGORICAL_COLUMNS if col in df.columns]
+        return df.astype({col: "category" for col in columns})
@@ -9,6 +9,9 @@ from typing import Iterator, List, Tuple
 
 import vcfpy
 
+# Upper bound for whole-contig tabix queries (VCF positions are 32-bit signed)
+MAX_POSITION = 2**31 - 1
+
 
 class VcfReader:
     """Reads VCF files and yields records with header information."""
@@ -53,6 +56,18 @@ class VcfReader:
         for idx, record in enumerate(self._reader):
             yield idx, record
 
+    def fetch_records(self, contig: str) -> Iterator[Tuple[int, vcfpy.Record]]:
+        """Read the VCF records of a single contig through the tabix index.
+
+        Args:
+            contig: Contig name as stored in the index
+
+        Yields:
+            Tuple of (index, record) where index is 0-based within the contig
+        """
+        for idx, record in enumerate(self._reader.fetch(contig, 0, MAX_POSITION)):
+            yield idx, record
+
     def close(self) -> None:
         """Close the VCF reader."""
         if self._reader:
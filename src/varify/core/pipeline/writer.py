@@ -182,11 +182,9 @@ class VcfWriter:
         Returns:
             Dictionary mapping (CHROM, POSITION) to row data
         """
-        df_lookup = {}
-        for _, row in df.iterrows():
-            key = (str(row["CHROM"]), int(row["POSITION"]))
-            df_lookup[key] = row
-        return df_lookup
+        # Plain dicts support the same `in`/[] access as iterrows() Series rows,
+        # without building a Series per record
+        return {(str(row["CHROM"]), int(row["POSITION"])): row for row in df.to_dict("records")}
 
     def _update_record(self, record: vcfpy.Record, df_lookup: Dict[tuple, Any]) -> None:
         """Update VCF record with data from DataFrame.
@@ -253,10 +251,10 @@ class VcfWriter:
             row_data: Row data from DataFrame
         """
         if "SUPP_CALLERS" in row_data and pd.notna(row_data["SUPP_CALLERS"]):
-            supp_callers_str = str(row_data["SUPP_CALLERS"])
-            record.INFO["SUPP_CALLERS"] = supp_callers_str.split(",")
+            supp_callers = str(row_data["SUPP_CALLERS"]).split(",")
+            record.INFO["SUPP_CALLERS"] = supp_callers
 
-            num_callers = len([c for c in supp_callers_str.split(",") if c.strip()])
+            num_callers = sum(1 for c in supp_callers if c.strip())
             record.INFO["NUM_CALLERS"] = num_callers
 
         if "PRIMARY_CALLER" in row_data and pd.notna(row_data["PRIMARY_CALLER"]):
@@ -310,10 +308,7 @@ class VcfWriter:
         target_sample_idx = 0
         if num_samples > 1:
             supp_vec = record.INFO.get("SUPP_VEC", "")
-            for i, bit in enumerate(str(supp_vec)):
-                if bit == "1":
-                    target_sample_idx = i
-                    break
+            target_sample_idx = max(str(supp_vec).find("1"), 0)
 
         for field in format_fields_to_update:
             if field not in row_data:
@@ -364,6 +359,37 @@ class VcfWriter:
                 if isinstance(value, str) and value.upper() in ("NAN", "NA"):
                     record.calls[sample_idx].data["ID"] = "."
 
+    @staticmethod
+    def _sort_vcf_lines(vcf_path: str, sorted_vcf_path: str) -> None:
+        """Sort VCF records by (CHROM, POS) without re-parsing them.
+
+        The file was just serialized by vcfpy, so records are sorted as raw text
+        lines keyed on their first two columns instead of being parsed again.
+
+        Args:
+            vcf_path: Path to the VCF file to sort
+            sorted_vcf_path: Path to write the sorted VCF file
+        """
+        header_lines = []
+        record_lines = []
+
+        with open(vcf_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#"):
+                    header_lines.append(line)
+                else:
+                    record_lines.append(line)
+
+        def sort_key(line: str) -> tuple[str, int]:
+            chrom, pos, _ = line.split("\t", 2)
+            return chrom, int(pos)
+
+        record_lines.sort(key=sort_key)
+
+        with open(sorted_vcf_path, "w", encoding="utf-8") as f:
+            f.writelines(header_lines)
+            f.writelines(record_lines)
+
     def compress_and_index(self, keep_uncompressed: bool = True) -> str:
         """Compress VCF with bgzip and create tabix index.
 
@@ -379,18 +405,7 @@ class VcfWriter:
 
         sorted_vcf_path = f"{vcf_path}.sorted"
         try:
-            reader = vcfpy.Reader.from_path(vcf_path)
-            writer = vcfpy.Writer.from_path(sorted_vcf_path, reader.header)
-
-            records = list(reader)
-
-            records.sort(key=lambda r: (r.CHROM, r.POS))
-
-            for record in records:
-                writer.write_record(record)
-
-            writer.close()
-            reader.close()
+            self._sort_vcf_lines(vcf_path, sorted_vcf_path)
 
             os.replace(sorted_vcf_path, vcf_path)
         except Exception as e:
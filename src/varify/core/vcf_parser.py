@@ -11,10 +11,15 @@ Parses VCF files using modular pipeline architecture:
 Supports both BCF and SURVIVOR formats with extensible caller system.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
+import pysam
+import vcfpy
 
 from .callers import (
     CuteSVVariantCaller,
@@ -34,6 +39,8 @@ from .pipeline import (
 )
 from .vcf_types import BCFHandler, SURVIVORHandler, VcfTypeHandler
 
+DEFAULT_CHUNK_SIZE = 50_000
+
 
 class VcfType(Enum):
     """Type of VCF file being parsed."""
@@ -74,7 +81,9 @@ def _get_caller_for_variant(primary_caller: Optional[str]) -> AbstractVariantCal
         return GenericVariantCaller()
 
 
-def parse_vcf(file_path: str, label: VcfType = VcfType.BCF) -> Tuple[pd.DataFrame, List[str]]:
+def parse_vcf(
+    file_path: str, label: VcfType = VcfType.BCF, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Tuple[pd.DataFrame, List[str]]:
     """Parse a VCF file using modular pipeline architecture.
 
     Pipeline stages:
@@ -85,33 +94,150 @@ def parse_vcf(file_path: str, label: VcfType = VcfType.BCF) -> Tuple[pd.DataFram
     5. Apply VCF type-specific processing (VcfTypeHandler)
     6. Aggregate SUPP_CALLERS if needed (Aggregator)
 
+    Records are buffered as dicts and flushed into a DataFrame every
+    ``chunk_size`` records. This bounds the per-record dicts, not peak memory; see
+    _parse_records().
+
     Args:
         file_path: Path to the VCF file
         label: Type of VCF file (BCF or SURVIVOR)
+        chunk_size: Number of records to buffer before flushing them into a DataFrame
+
+    Returns:
+        Tuple containing:
+            - DataFrame with parsed VCF records
+            - List of INFO column names from header
+    """
+    with VcfReader(file_path) as vcf_reader:
+        info_columns = vcf_reader.get_info_columns()
+        result, total_records = _parse_records(
+            vcf_reader.read_records(), label, vcf_reader.samples, chunk_size
+        )
+
+    return _finalize(result, label, total_records), info_columns
+
+
+def parse_vcf_parallel(
+    file_path: str,
+    label: VcfType = VcfType.BCF,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    n_workers: int = 1,
+) -> Tuple[pd.DataFrame, List[str]]:
+    """Parse an indexed VCF file with one worker process per contig.
+
+    Each worker fetches one contig through the tabix index and runs the per-record
+    pipeline stages on it. The partial DataFrames are concatenated in index order,
+    which is file order for a sorted VCF, so the result matches parse_vcf().
+    Validation and aggregation run once on the merged DataFrame.
+
+    Falls back to parse_vcf() when the file has no .tbi/.csi index, spans a
+    single contig, or only one worker is requested.
+
+    Args:
+        file_path: Path to the bgzipped VCF file
+        label: Type of VCF file (BCF or SURVIVOR)
+        chunk_size: Number of records to buffer before flushing them into a DataFrame
+        n_workers: Number of worker processes; 1 parses in the calling process
 
     Returns:
         Tuple containing:
             - DataFrame with parsed VCF records
             - List of INFO column names from header
     """
-    # Initialize pipeline components
-    vcf_reader = VcfReader(file_path)
+    contigs = _indexed_contigs(file_path)
+
+    if n_workers <= 1 or len(contigs) <= 1:
+        return parse_vcf(file_path, label=label, chunk_size=chunk_size)
+
+    with VcfReader(file_path) as vcf_reader:
+        info_columns = vcf_reader.get_info_columns()
+
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(contigs))) as executor:
+        parts = list(
+            executor.map(
+                _parse_contig, repeat(file_path), contigs, repeat(label), repeat(chunk_size)
+            )
+        )
+
+    result = _concat_chunks([df for df, _ in parts])
+    total_records = sum(count for _, count in parts)
+
+    # Per-contig indices restart at 0; renumber to match a serial read of the file
+    if not result.empty:
+        result["unique_id"] = range(len(result))
+
+    return _finalize(result, label, total_records), info_columns
+
+
+def _indexed_contigs(file_path: str) -> List[str]:
+    """List the contigs present in a VCF's tabix/CSI index.
+
+    Args:
+        file_path: Path to the bgzipped VCF file
+
+    Returns:
+        Contig names in index order, or an empty list if the file is not indexed
+    """
+    if not (os.path.exists(f"{file_path}.tbi") or os.path.exists(f"{file_path}.csi")):
+        return []
+
+    try:
+        with pysam.TabixFile(file_path) as tabix_file:
+            return list(tabix_file.contigs)
+    except (OSError, ValueError):
+        return []
+
+
+def _parse_contig(
+    file_path: str, contig: str, label: VcfType, chunk_size: int
+) -> Tuple[pd.DataFrame, int]:
+    """Parse the records of a single contig (worker entry point for parse_vcf_parallel).
 
+    Returns:
+        Tuple of (unvalidated DataFrame, number of records read)
+    """
+    with VcfReader(file_path) as vcf_reader:
+        return _parse_records(
+            vcf_reader.fetch_records(contig), label, vcf_reader.samples, chunk_size
+        )
+
+
+def _parse_records(
+    records: Iterable[Tuple[int, vcfpy.Record]],
+    label: VcfType,
+    samples: List[str],
+    chunk_size: int,
+) -> Tuple[pd.DataFrame, int]:
+    """Run the per-record pipeline stages and build the raw DataFrame.
+
+    Only the current chunk is held as per-record dicts, but every chunk DataFrame
+    stays alive until _concat_chunks() combines them, so peak memory is roughly
+    twice the size of the returned DataFrame.
+
+    Args:
+        records: Iterator of (index, record) tuples from VcfReader
+        label: Type of VCF file (BCF or SURVIVOR)
+        samples: Sample names from the VCF header
+        chunk_size: Number of records to buffer before flushing them into a DataFrame
+
+    Returns:
+        Tuple of (unvalidated DataFrame, number of records read)
+    """
     # Initialize processors
     general_processor = GeneralProcessor()
 
     # Initialize VCF type handler (BCF vs SURVIVOR)
     vcf_type_handler: VcfTypeHandler = BCFHandler() if label == VcfType.BCF else SURVIVORHandler()
 
-    # Extract header info
-    info_columns = vcf_reader.get_info_columns()
-    samples = vcf_reader.samples
+    # Callers are stateless, so one processor per distinct PRIMARY_CALLER is reused
+    caller_processors: Dict[Optional[str], CallerProcessor] = {}
 
     # Process records through pipeline
-    records: List[Dict[str, Any]] = []
+    buffer: List[Dict[str, Any]] = []
+    chunks: List[pd.DataFrame] = []
     total_records = 0
 
-    for idx, record in vcf_reader.read_records():
+    for idx, record in records:
         total_records += 1
         info = record.INFO
 
@@ -132,8 +258,10 @@ def parse_vcf(file_path: str, label: VcfType = VcfType.BCF) -> Tuple[pd.DataFram
         primary_caller = vcf_type_handler.extract_primary_caller(info, record)
 
         # Get appropriate caller class based on PRIMARY_CALLER
-        caller = _get_caller_for_variant(primary_caller)
-        caller_processor = CallerProcessor(caller)
+        caller_processor = caller_processors.get(primary_caller)
+        if caller_processor is None:
+            caller_processor = CallerProcessor(_get_caller_for_variant(primary_caller))
+            caller_processors[primary_caller] = caller_processor
 
         # Stage 5: Caller-specific processing
         record_data = caller_processor.process_record(record, info, core_fields)
@@ -149,18 +277,56 @@ def parse_vcf(file_path: str, label: VcfType = VcfType.BCF) -> Tuple[pd.DataFram
         sample_fields = vcf_type_handler.process_sample_fields(record, samples)
         record_data.update(sample_fields)
 
-        records.append(record_data)
+        buffer.append(record_data)
 
-    # Close reader
-    vcf_reader.close()
+        if len(buffer) >= chunk_size:
+            chunks.append(pd.DataFrame(buffer))
+            buffer = []
 
     # Convert to DataFrame
-    result = pd.DataFrame(records)
+    if buffer:
+        chunks.append(pd.DataFrame(buffer))
+
+    return _concat_chunks(chunks), total_records
+
+
+def _concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate DataFrame chunks into a single DataFrame.
+
+    Args:
+        chunks: DataFrame chunks in record order
 
+    Returns:
+        Combined DataFrame (empty if there are no records)
+    """
+    chunks = [chunk for chunk in chunks if not chunk.empty]
+
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+
+    # Chunks with all-missing columns come back as object dtype; re-infer after concat
+    return pd.concat(chunks, ignore_index=True).infer_objects()
+
+
+def _finalize(result: pd.DataFrame, label: VcfType, total_records: int) -> pd.DataFrame:
+    """Run the DataFrame-level pipeline stages on parsed records.
+
+    Args:
+        result: Unvalidated DataFrame from _parse_records
+        label: Type of VCF file (BCF or SURVIVOR)
+        total_records: Number of records read from the VCF
+
+    Returns:
+        Validated, aggregated DataFrame
+    """
     # Handle empty result - just return empty DataFrame
     # Writer will handle empty DataFrames gracefully with a warning
     if result.empty:
-        return result, info_columns
+        return result
+
+    vcf_type_handler: VcfTypeHandler = BCFHandler() if label == VcfType.BCF else SURVIVORHandler()
 
     # Stage 8: Validate and filter records (in Aggregator)
     result, excluded_records, invalid_records = Aggregator.validate_and_filter(result)
@@ -169,10 +335,13 @@ def parse_vcf(file_path: str, label: VcfType = VcfType.BCF) -> Tuple[pd.DataFram
     if vcf_type_handler.should_aggregate():
         result = Aggregator.aggregate(result)
 
+    # Stage 10: Store low-cardinality columns as categoricals
+    result = GeneralProcessor.compact_dtypes(result)
+
     # Print statistics
     Aggregator.print_statistics(result, total_records, excluded_records, invalid_records)
 
-    return result, info_columns
+    return result
 
 
 def write_enriched_vcf(original_vcf_path: str, df: pd.DataFrame, output_path: str) -> None:
@@ -5,37 +5,75 @@ Handles VCF processing pipeline including parsing and stats generation.
 Eliminates duplication between BCF and SURVIVOR processing workflows.
 """
 
+import functools
+import hashlib
 import os
 from typing import Optional, Tuple
 
 import pandas as pd
 
 from .pipeline import VcfWriter
-from .vcf_parser import VcfType, parse_vcf
+from .vcf_parser import DEFAULT_CHUNK_SIZE, VcfType, parse_vcf, parse_vcf_parallel
+
+CACHE_DIRNAME = ".varify_cache"
+
+# Bump when the parsed DataFrame layout changes so stale cache entries are ignored
+CACHE_FORMAT_VERSION = 2
+
+
+@functools.lru_cache(maxsize=1)
+def _parser_fingerprint() -> str:
+    """Hash the sources of the core package that parse and aggregate VCFs.
+
+    Part of the cache key, so a cache written by a different version of the
+    parsing code is never loaded, even if CACHE_FORMAT_VERSION was not bumped.
+
+    Returns:
+        Hex digest of the core package's Python sources
+    """
+    core_dir = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.blake2b(digest_size=16)
+    for root, dirs, files in os.walk(core_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, core_dir).encode("utf-8"))
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
 
 
 class VcfProcessor:
     """Processes VCF files with unified pipeline for BCF and SURVIVOR types."""
 
-    def __init__(self, vcf_type: VcfType, vcf_path: str, output_dir: str):
+    def __init__(self, vcf_type: VcfType, vcf_path: str, output_dir: str, use_cache: bool = False):
         """Initialize VCF processor.
 
         Args:
             vcf_type: Type of VCF file (BCF or SURVIVOR)
             vcf_path: Path to VCF file
             output_dir: Output directory for generated files
+            use_cache: Reuse the parsed DataFrame cached in output_dir when the VCF is unchanged.
+                The cache is a pickle, so only enable it for output directories you trust.
         """
         self.vcf_type = vcf_type
         self.vcf_path = vcf_path
         self.output_dir = output_dir
+        self.use_cache = use_cache
 
     def process(
-        self, stats_file: Optional[str] = None
+        self,
+        stats_file: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        n_workers: int = 1,
     ) -> Tuple[Optional[pd.DataFrame], Optional[dict], Optional[dict], Optional[str]]:
         """Process VCF file and parse stats.
 
         Args:
             stats_file: Path to stats file (bcftools.stats or survivor.stats)
+            chunk_size: Number of records parsed per DataFrame chunk
+            n_workers: Worker processes for per-contig parsing of indexed VCFs
 
         Returns:
             Tuple of (dataframe, stats_dict, None, enriched_vcf_path)
@@ -44,8 +82,8 @@ class VcfProcessor:
         if not os.path.exists(self.vcf_path):
             raise FileNotFoundError(f"VCF file '{self.vcf_path}' does not exist.")
 
-        df, _ = parse_vcf(self.vcf_path, label=self.vcf_type)
         os.makedirs(self.output_dir, exist_ok=True)
+        df = self._parse_cached(chunk_size, n_workers)
 
         writer = VcfWriter(
             original_vcf_path=self.vcf_path,
@@ -57,3 +95,71 @@ class VcfProcessor:
         self.enriched_vcf_path = writer.write_and_compress(compress=True, keep_uncompressed=True)
 
         return df, None, None, self.enriched_vcf_path
+
+    def _cache_path(self) -> str:
+        """Build the cache file path for the current VCF.
+
+        The key covers the absolute path, modification time and size of the VCF
+        and a hash of the parsing code, so any change to the input or to the
+        parser invalidates its cache entry.
+
+        Returns:
+            Path to the pickled DataFrame inside the output cache directory
+        """
+        stat = os.stat(self.vcf_path)
+        key = "|".join(
+            [
+                str(CACHE_FORMAT_VERSION),
+                _parser_fingerprint(),
+                self.vcf_type.value,
+                os.path.abspath(self.vcf_path),
+                str(stat.st_mtime_ns),
+                str(stat.st_size),
+            ]
+        )
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.output_dir, CACHE_DIRNAME, f"{digest}.pkl")
+
+    def _parse(self, chunk_size: int, n_workers: int) -> pd.DataFrame:
+        """Parse the VCF, splitting indexed files by contig when n_workers > 1."""
+        if n_workers > 1:
+            df, _ = parse_vcf_parallel(
+                self.vcf_path, label=self.vcf_type, chunk_size=chunk_size, n_workers=n_workers
+            )
+        else:
+            df, _ = parse_vcf(self.vcf_path, label=self.vcf_type, chunk_size=chunk_size)
+        return df
+
+    def _parse_cached(self, chunk_size: int, n_workers: int = 1) -> pd.DataFrame:
+        """Parse the VCF, reusing a cached DataFrame from a previous run if possible.
+
+        Args:
+            chunk_size: Number of records parsed per DataFrame chunk
+            n_workers: Worker processes for per-contig parsing of indexed VCFs
+
+        Returns:
+            Parsed DataFrame
+        """
+        if not self.use_cache:
+            return self._parse(chunk_size, n_workers)
+
+        cache_path = self._cache_path()
+        if os.path.exists(cache_path):
+            try:
+                df = pd.read_pickle(cache_path)
+                print(f"Loaded parsed {self.vcf_type.name} VCF from cache: {cache_path}")
+                return df
+            except Exception as e:
+                print(f"Warning: Ignoring unreadable cache {cache_path}: {e}")
+
+        df = self._parse(chunk_size, n_workers)
+
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write parse cache {cache_path}: {e}")
+
+        return df
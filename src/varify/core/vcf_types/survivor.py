@@ -121,11 +121,7 @@ class SURVIVORHandler(VcfTypeHandler):
         supp_vec = record.INFO.get("SUPP_VEC", "")
 
         # Find first sample with data (first '1' in SUPP_VEC)
-        active_sample_idx = 0
-        for i, bit in enumerate(str(supp_vec)):
-            if bit == "1":
-                active_sample_idx = i
-                break
+        active_sample_idx = max(str(supp_vec).find("1"), 0)
 
         # Extract FORMAT fields from active sample only
         sample_data = {}
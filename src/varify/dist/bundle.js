@@ -0,0 +1 @@
+window.Varify={};
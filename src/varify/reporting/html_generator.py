@@ -1,7 +1,14 @@
 import datetime
+import functools
 import hashlib
 import json
 import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+METADATA_PLACEHOLDER = b"<!-- REPORT_METADATA -->"
 
 
 def summarize_sv(df):
@@ -15,11 +22,14 @@ def summarize_sv(df):
     if df is None:
         return None
     total_sv = len(df)
-    unique_sv = df["SVTYPE"].nunique() if "SVTYPE" in df.columns else "N/A"
-    if "QUAL" in df.columns and not df["QUAL"].isna().all():
-        mqs = round(df["QUAL"].median(), 2)
-    else:
-        mqs = "N/A"
+    unique_sv = count_unique(df["SVTYPE"]) if "SVTYPE" in df.columns else "N/A"
+    mqs = "N/A"
+    if "QUAL" in df.columns:
+        qual = df["QUAL"].to_numpy(dtype="float64", na_value=np.nan)
+        # Boolean indexing already copied the values, so median may partition them in place
+        qual = qual[~np.isnan(qual)]
+        if qual.size:
+            mqs = round(float(np.median(qual, overwrite_input=True)), 2)
     return {
         "total_sv": total_sv,
         "unique_sv": unique_sv,
@@ -27,6 +37,23 @@ def summarize_sv(df):
     }
 
 
+def count_unique(series):
+    """
+    Count distinct non-null values of a Series.
+    Categorical columns are counted from their integer codes, which skips hashing
+    the values; unused categories are not counted.
+    Args:
+        series: pandas Series
+    Returns:
+        Number of distinct non-null values
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        return int(np.count_nonzero(np.bincount(codes, minlength=len(series.cat.categories))))
+    return series.nunique()
+
+
 def get_package_resource(relative_path):
     """
     Get absolute path to a package resource file.
@@ -43,6 +70,67 @@ def get_package_resource(relative_path):
     return os.path.join(package_dir, relative_path)
 
 
+def load_report_shell(template_path, bundle_js_path, bundle_css_path):
+    """
+    Get the report template with the CSS and JS bundles inlined.
+    Only the metadata differs between reports, so the inlined shell is built
+    and split at the metadata placeholder once, then reused until one of the
+    three files changes.
+    Args:
+        template_path: Path to the HTML template
+        bundle_js_path: Path to the JavaScript bundle
+        bundle_css_path: Path to the CSS bundle
+    Returns:
+        Tuple of UTF-8 encoded HTML segments; the metadata script goes between
+        consecutive segments
+    """
+    keys = []
+    for path in (template_path, bundle_js_path, bundle_css_path):
+        stat = os.stat(path)
+        keys.append((path, stat.st_mtime_ns, stat.st_size))
+    return _build_report_shell(*keys)
+
+
+@functools.lru_cache(maxsize=2)
+def _build_report_shell(template_key, bundle_js_key, bundle_css_key):
+    """Inline the bundles into the template; the keys are (path, mtime_ns, size)."""
+    # Files are UTF-8, so splicing them as bytes avoids decoding and re-encoding the bundles
+    with open(template_key[0], "rb") as f:
+        html_content = f.read()
+    with open(bundle_js_key[0], "rb") as f:
+        bundle_js = f.read()
+    with open(bundle_css_key[0], "rb") as f:
+        bundle_css = f.read()
+
+    html_content = html_content.replace(
+        b"<!-- BUNDLE_CSS -->", b"<style>" + bundle_css + b"</style>"
+    )
+    html_content = html_content.replace(
+        b"<!-- BUNDLE_JS -->", b"<script>" + bundle_js + b"</script>"
+    )
+    return tuple(html_content.split(METADATA_PLACEHOLDER))
+
+
+def copy_if_changed(src, dest):
+    """
+    Copy a file unless dest already holds an identical copy from a previous run.
+    Args:
+        src: Source file path
+        dest: Destination file path
+    Returns:
+        True if the file was copied, False if the existing copy was reused
+    """
+    if os.path.exists(dest):
+        src_stat = os.stat(src)
+        dest_stat = os.stat(dest)
+        # copy2 preserves mtime to the nanosecond, so an unchanged source matches its
+        # earlier copy while a same-size rewrite within the same second does not
+        if src_stat.st_size == dest_stat.st_size and src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+            return False
+    shutil.copy2(src, dest)
+    return True
+
+
 def generate_combined_report(
     combined_report_file,
     bcf_vcf_path,
@@ -54,15 +142,21 @@ def generate_combined_report(
     reference_name,
     bcf_stats_file=None,
     survivor_stats_file=None,
+    bcf_summary=None,
+    survivor_summary=None,
 ):
     """
     Generate Varify report with metadata.json and pre-bundled HTML.
 
     Stats files are copied to genome_files/ and parsed in browser (not in Python).
+    The report only needs the summarize_sv() values of each DataFrame, so callers may
+    pass precomputed bcf_summary/survivor_summary and None for the DataFrames.
     """
 
-    bcf_summary = summarize_sv(bcf_df)
-    survivor_summary = summarize_sv(survivor_df)
+    if bcf_summary is None:
+        bcf_summary = summarize_sv(bcf_df)
+    if survivor_summary is None:
+        survivor_summary = summarize_sv(survivor_df)
     output_dir = os.path.dirname(combined_report_file)
     if not output_dir:
         output_dir = "."
@@ -77,8 +171,6 @@ def generate_combined_report(
 
     os.makedirs(genome_files_dir, exist_ok=True)
 
-    import shutil
-
     copied_files = []
 
     source_files = []
@@ -98,11 +190,11 @@ def generate_combined_report(
         fasta_fai_src = fasta_path + ".fai"
         fasta_fai_dest = fasta_dest + ".fai"
 
-        shutil.copy2(fasta_path, fasta_dest)
+        copy_if_changed(fasta_path, fasta_dest)
         copied_files.append(fasta_dest)
 
         if os.path.exists(fasta_fai_src):
-            shutil.copy2(fasta_fai_src, fasta_fai_dest)
+            copy_if_changed(fasta_fai_src, fasta_fai_dest)
             copied_files.append(fasta_fai_dest)
 
     if bcf_vcf_path and os.path.exists(bcf_vcf_path):
@@ -156,13 +248,13 @@ def generate_combined_report(
     if bcf_stats_file and os.path.exists(bcf_stats_file):
         bcf_stats_filename = os.path.basename(bcf_stats_file)
         bcf_stats_dest = os.path.join(genome_files_dir, bcf_stats_filename)
-        shutil.copy2(bcf_stats_file, bcf_stats_dest)
+        copy_if_changed(bcf_stats_file, bcf_stats_dest)
         copied_files.append(bcf_stats_dest)
 
     if survivor_stats_file and os.path.exists(survivor_stats_file):
         survivor_stats_filename = os.path.basename(survivor_stats_file)
         survivor_stats_dest = os.path.join(genome_files_dir, survivor_stats_filename)
-        shutil.copy2(survivor_stats_file, survivor_stats_dest)
+        copy_if_changed(survivor_stats_file, survivor_stats_dest)
         copied_files.append(survivor_stats_dest)
 
     version_parts = []
@@ -203,7 +295,8 @@ def generate_combined_report(
     template_path = get_package_resource("templates/report-template.html")
     bundle_js_path = get_package_resource("dist/bundle.js")
     bundle_css_path = get_package_resource("dist/bundle.css")
-    metadata_json = json.dumps(metadata, ensure_ascii=False)
+    # Escape "<" so values such as the profile or file names cannot close the script tag
+    metadata_json = json.dumps(metadata, ensure_ascii=False).replace("<", "\\u003c")
 
     for path, name in [
         (template_path, "Template"),
@@ -216,29 +309,21 @@ def generate_combined_report(
             )
 
     try:
-        with open(bundle_js_path, "r", encoding="utf-8") as f:
-            bundle_js = f.read()
-        with open(bundle_css_path, "r", encoding="utf-8") as f:
-            bundle_css = f.read()
+        segments = load_report_shell(template_path, bundle_js_path, bundle_css_path)
     except FileNotFoundError as e:
         print("ERROR: Bundle files not found. Please run: npm run build:package")
         print(f"Looking for: {bundle_js_path}")
         raise e
 
-    with open(template_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
-
-    bundled_css = f"<style>{bundle_css}</style>"
-    bundled_js = f"<script>{bundle_js}</script>"
-
     metadata_script = f"<script>window.REPORT_METADATA = {metadata_json};</script>"
-
-    html_content = html_content.replace("<!-- BUNDLE_CSS -->", bundled_css)
-    html_content = html_content.replace("<!-- BUNDLE_JS -->", bundled_js)
-    html_content = html_content.replace("<!-- REPORT_METADATA -->", metadata_script)
-
-    with open(combined_report_file, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    metadata_script = metadata_script.encode("utf-8")
+
+    # Write the shell around the metadata instead of building the whole document again
+    with open(combined_report_file, "wb") as f:
+        f.write(segments[0])
+        for segment in segments[1:]:
+            f.write(metadata_script)
+            f.write(segment)
 
     print(f"Report: {combined_report_file}")
     print(f"Genome files: {len(copied_files)} files -> {genome_files_dir}/")
@@ -0,0 +1,23 @@
+"""
+Tests for varify command-line argument parsing.
+"""
+
+import pytest
+
+from src.varify.cli.commands import parse_args
+
+
+@pytest.mark.parametrize("option", ["--workers", "--chunk-size"])
+@pytest.mark.parametrize("value", ["0", "-2", "two"])
+def test_parse_args_rejects_non_positive_counts(option, value, capsys):
+    """Test --workers and --chunk-size only accept integers of at least 1."""
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(["--fasta-file", "ref.fa", option, value])
+
+    assert excinfo.value.code == 2
+    assert option in capsys.readouterr().err
+
+
+def test_parse_args_accepts_positive_workers():
+    """Test --workers keeps a positive worker count."""
+    assert parse_args(["--fasta-file", "ref.fa", "--workers", "3"]).workers == 3
@@ -0,0 +1,244 @@
+"""
+Tests for the varify serve/submit daemon.
+"""
+
+import io
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from src.varify.cli import serve as serve_module
+from src.varify.cli.serve import EXIT_MARKER, _daemon_listening, submit
+
+
+class FakeSocket:
+    """Client socket that returns scripted chunks from recv()."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.sent = b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def connect(self, path):
+        pass
+
+    def sendall(self, data):
+        self.sent += data
+
+    def recv(self, bufsize):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+class FakeStdout:
+    """Stand-in for sys.stdout whose bytes can be inspected."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+
+@pytest.fixture
+def socket_dir():
+    """Short temporary directory, since Unix socket paths are length-limited."""
+    path = tempfile.mkdtemp(prefix="varify-")
+    yield Path(path)
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def spawn_daemon(socket_path):
+    """Start `varify serve` on socket_path in a subprocess."""
+    project_root = Path(__file__).parent.parent.parent
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from src.varify.cli.serve import serve; serve(sys.argv[1])",
+            str(socket_path),
+        ],
+        cwd=project_root,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+
+def wait_until_listening(process, socket_path):
+    """Wait until the daemon accepts connections on socket_path."""
+    deadline = time.monotonic() + 60
+    while True:
+        try:
+            if _daemon_listening(str(socket_path)):
+                return
+        except OSError:
+            pass
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            pytest.fail("Varify daemon did not start")
+        time.sleep(0.05)
+
+
+def stop(process):
+    """Kill a daemon subprocess if it is still running."""
+    if process.poll() is None:
+        process.kill()
+        process.wait()
+
+
+@pytest.fixture
+def daemon(socket_dir):
+    """Run `varify serve` in a subprocess and yield it with its socket path."""
+    socket_path = socket_dir / "varify.sock"
+    process = spawn_daemon(socket_path)
+    wait_until_listening(process, socket_path)
+
+    yield process, socket_path
+
+    stop(process)
+
+
+def run_submit(monkeypatch, argv, socket_path):
+    """Submit a job and return (exit_code, output bytes)."""
+    stdout = FakeStdout()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    exit_code = submit(argv, str(socket_path))
+    return exit_code, stdout.buffer.getvalue()
+
+
+def run_scripted_submit(monkeypatch, chunks):
+    """Submit against a fake socket that delivers the given chunks."""
+    monkeypatch.setattr(serve_module.socket, "socket", lambda *args: FakeSocket(chunks))
+    return run_submit(monkeypatch, ["--help"], "unused.sock")
+
+
+def test_submit_success_round_trip(daemon, monkeypatch):
+    """Test a successful job streams its output and exits with 0."""
+    _, socket_path = daemon
+
+    exit_code, output = run_submit(monkeypatch, ["--help"], socket_path)
+
+    assert exit_code == 0
+    assert b"usage: varify" in output
+    assert EXIT_MARKER not in output
+
+
+def test_submit_failure_round_trip(daemon, monkeypatch):
+    """Test a failing job streams its error output and exit code."""
+    _, socket_path = daemon
+
+    exit_code, output = run_submit(monkeypatch, ["--report-file", "x.html"], socket_path)
+
+    assert exit_code == 2
+    assert b"--fasta-file" in output
+
+
+def test_submit_job_exception_includes_traceback(daemon, monkeypatch, socket_dir):
+    """Test an exception raised by a job reports its traceback and exits with 1."""
+    _, socket_path = daemon
+    argv = [
+        "--output-dir",
+        str(socket_dir / "out"),
+        "--fasta-file",
+        str(socket_dir / "missing.fna"),
+        "--bcf-vcf-file",
+        str(socket_dir / "missing.vcf"),
+    ]
+
+    exit_code, output = run_submit(monkeypatch, argv, socket_path)
+
+    assert exit_code == 1
+    assert b"ERROR:" in output
+    assert b"Traceback (most recent call last)" in output
+
+
+def test_submit_exit_code_split_across_reads(monkeypatch):
+    """Test the exit code is read completely when its digits arrive separately."""
+    chunks = [b"job output\n" + EXIT_MARKER, b"4", b"2\n"]
+
+    exit_code, output = run_scripted_submit(monkeypatch, chunks)
+
+    assert exit_code == 42
+    assert output == b"job output\n"
+
+
+def test_submit_exit_marker_split_across_reads(monkeypatch):
+    """Test a marker split across reads is not written to the output."""
+    marker_split = len(EXIT_MARKER) // 2
+    chunks = [
+        b"job output\n" + EXIT_MARKER[:marker_split],
+        EXIT_MARKER[marker_split:],
+        b"0\n",
+    ]
+
+    exit_code, output = run_scripted_submit(monkeypatch, chunks)
+
+    assert exit_code == 0
+    assert output == b"job output\n"
+
+
+def test_submit_connection_closed_before_exit_code(monkeypatch):
+    """Test a connection closed before the exit code arrives is reported as a failure."""
+    exit_code, output = run_scripted_submit(monkeypatch, [b"partial output", EXIT_MARKER])
+
+    assert exit_code == 1
+    assert output == b"partial output"
+
+
+def test_serve_removes_socket_on_shutdown(daemon):
+    """Test the daemon removes its socket file when terminated."""
+    process, socket_path = daemon
+
+    process.send_signal(signal.SIGTERM)
+    assert process.wait(timeout=30) == 0
+    assert not os.path.exists(socket_path)
+
+
+@pytest.mark.parametrize("command", ["serve", "submit"])
+def test_submit_rejects_daemon_commands(daemon, monkeypatch, command):
+    """Test a job cannot start or submit to a daemon from inside the daemon."""
+    process, socket_path = daemon
+
+    exit_code, output = run_submit(monkeypatch, [command, "--socket", "other.sock"], socket_path)
+
+    assert exit_code == 2
+    assert b"cannot be run as a daemon job" in output
+    assert process.poll() is None
+    assert run_submit(monkeypatch, ["--help"], socket_path)[0] == 0
+
+
+def test_serve_refuses_to_replace_running_daemon(daemon):
+    """Test a second daemon on the same socket exits and leaves the first one reachable."""
+    process, socket_path = daemon
+
+    second = spawn_daemon(socket_path)
+    _, stderr = second.communicate(timeout=60)
+
+    assert second.returncode == 1
+    assert b"already running" in stderr
+    assert process.poll() is None
+    assert _daemon_listening(str(socket_path))
+
+
+def test_serve_replaces_stale_socket(socket_dir, monkeypatch):
+    """Test a socket file left without a listening daemon is replaced."""
+    socket_path = socket_dir / "varify.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(socket_path))
+    assert socket_path.exists()
+
+    process = spawn_daemon(socket_path)
+    try:
+        wait_until_listening(process, socket_path)
+        assert run_submit(monkeypatch, ["--help"], socket_path)[0] == 0
+    finally:
+        stop(process)
@@ -2,6 +2,7 @@
 
 from unittest.mock import Mock
 
+import pandas as pd
 import pytest
 import vcfpy
 
@@ -256,3 +257,32 @@ def test_validate_required_fields_with_extra_fields(processor):
         "CUSTOM": "value",
     }
     assert processor.validate_required_fields(record_data) is True
+
+
+def test_compact_dtypes_categorical_columns(processor):
+    """Test low-cardinality columns become categoricals and others are untouched."""
+    df = pd.DataFrame(
+        {
+            "CHROM": ["chr1", "chr1", "chr2"],
+            "POSITION": [100, 200, 300],
+            "SVTYPE": ["DEL", "DEL", "INS"],
+            "PRIMARY_CALLER": ["sniffles", None, "sniffles"],
+            "QUAL": [10.0, None, 30.0],
+        }
+    )
+
+    result = processor.compact_dtypes(df)
+
+    assert isinstance(result["CHROM"].dtype, pd.CategoricalDtype)
+    assert isinstance(result["SVTYPE"].dtype, pd.CategoricalDtype)
+    assert isinstance(result["PRIMARY_CALLER"].dtype, pd.CategoricalDtype)
+    assert result["PRIMARY_CALLER"].cat.categories.tolist() == ["sniffles"]
+    assert result["QUAL"].dtype == "float64"
+    assert result["POSITION"].dtype == df["POSITION"].dtype
+    assert result["SVTYPE"].tolist() == ["DEL", "DEL", "INS"]
+
+
+def test_compact_dtypes_empty(processor):
+    """Test empty DataFrame is returned unchanged."""
+    df = pd.DataFrame()
+    assert processor.compact_dtypes(df) is df
@@ -607,3 +607,27 @@ class TestVcfWriterEdgeCases:
         assert records[2].chrom == "chr2" and records[2].pos == 500
 
         vcf.close()
+
+
+def test_sort_vcf_lines_orders_records_by_chrom_and_position(temp_output_dir):
+    """Test that records are sorted by (CHROM, POS) and header lines are kept first."""
+    vcf_path = temp_output_dir / "unsorted.vcf"
+    sorted_path = temp_output_dir / "sorted.vcf"
+    vcf_path.write_text(
+        "##fileformat=VCFv4.2\n"
+        "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+        "chr2\t500\t.\tN\t<DUP>\t.\tPASS\t.\n"
+        "chr1\t2000\t.\tN\t<INS>\t.\tPASS\t.\n"
+        "chr1\t300\t.\tN\t<DEL>\t.\tPASS\t.\n"
+    )
+
+    VcfWriter._sort_vcf_lines(str(vcf_path), str(sorted_path))
+
+    lines = sorted_path.read_text().splitlines()
+    assert lines[0].startswith("##fileformat")
+    assert lines[1].startswith("#CHROM")
+    assert [tuple(line.split("\t")[:2]) for line in lines[2:]] == [
+        ("chr1", "300"),
+        ("chr1", "2000"),
+        ("chr2", "500"),
+    ]
@@ -7,7 +7,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from src.varify.core.vcf_parser import VcfType, parse_vcf
+from src.varify.core.vcf_parser import VcfType, parse_vcf, parse_vcf_parallel
 
 
 @pytest.fixture
@@ -137,6 +137,14 @@ def test_parse_vcf_empty_file():
         Path(temp_path).unlink()
 
 
+def test_parse_vcf_chunked_matches_single_chunk(sample_vcf_path, sample_vcf_data):
+    """Test that parsing in small chunks yields the same DataFrame as one chunk."""
+    df, _ = sample_vcf_data
+    chunked_df, _ = parse_vcf(str(sample_vcf_path), VcfType.BCF, chunk_size=5)
+
+    pd.testing.assert_frame_equal(chunked_df, df)
+
+
 def test_vcf_type_enum():
     """Test VcfType enum values."""
     assert VcfType.BCF.value == "bcf"
@@ -175,3 +183,22 @@ def test_ref_alt_alleles(sample_vcf_data):
     assert isinstance(first_variant["ALT"], str), "ALT should be a string"
     assert len(first_variant["REF"]) == 1, "REF should be 'N' (1 character)"
     assert len(first_variant["ALT"]) == 5, "ALT should be '<DEL>' (5 characters)"
+
+
+def test_parse_vcf_parallel_matches_serial():
+    """Test per-contig parallel parsing of an indexed VCF matches a serial parse."""
+    vcf_path = str(Path(__file__).parent.parent / "fixtures" / "bcftools_concat.vcf.gz")
+
+    serial_df, serial_info = parse_vcf(vcf_path, label=VcfType.BCF)
+    parallel_df, parallel_info = parse_vcf_parallel(vcf_path, label=VcfType.BCF, n_workers=2)
+
+    assert parallel_info == serial_info
+    pd.testing.assert_frame_equal(parallel_df, serial_df)
+
+
+def test_parse_vcf_parallel_falls_back_without_index(sample_vcf_path):
+    """Test unindexed VCFs are parsed serially."""
+    serial_df, _ = parse_vcf(str(sample_vcf_path), label=VcfType.BCF)
+    parallel_df, _ = parse_vcf_parallel(str(sample_vcf_path), label=VcfType.BCF, n_workers=2)
+
+    pd.testing.assert_frame_equal(parallel_df, serial_df)
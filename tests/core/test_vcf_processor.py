@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from src.varify.core import VcfProcessor, VcfType
@@ -84,3 +85,41 @@ def test_vcf_processor_no_stats(sample_vcf_path, temp_output_dir):
 
     assert enriched_vcf_path is not None
     assert Path(enriched_vcf_path).exists()
+
+
+def test_vcf_processor_reuses_parse_cache(sample_vcf_path, temp_output_dir, monkeypatch):
+    """Test a second run loads the parsed DataFrame from the cache."""
+    processor = VcfProcessor(VcfType.BCF, str(sample_vcf_path), temp_output_dir, use_cache=True)
+    df, _, _, _ = processor.process()
+
+    cache_path = Path(processor._cache_path())
+    assert cache_path.exists()
+    assert cache_path.parent.name == ".varify_cache"
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("parse_vcf should not run on a cache hit")
+
+    monkeypatch.setattr("src.varify.core.vcf_processor.parse_vcf", fail_parse)
+    cached_df, _, _, enriched_vcf_path = processor.process()
+
+    pd.testing.assert_frame_equal(df, cached_df)
+    assert Path(enriched_vcf_path).exists()
+
+
+def test_vcf_processor_cache_disabled_by_default(sample_vcf_path, temp_output_dir):
+    """Test no cache is written or read unless caching is enabled."""
+    processor = VcfProcessor(VcfType.BCF, str(sample_vcf_path), temp_output_dir)
+    processor.process()
+
+    assert not processor.use_cache
+    assert not (Path(temp_output_dir) / ".varify_cache").exists()
+
+
+def test_vcf_processor_cache_key_covers_parser(sample_vcf_path, temp_output_dir, monkeypatch):
+    """Test a change to the parsing code moves the cache to a new key."""
+    processor = VcfProcessor(VcfType.BCF, str(sample_vcf_path), temp_output_dir, use_cache=True)
+    cache_path = processor._cache_path()
+
+    monkeypatch.setattr("src.varify.core.vcf_processor._parser_fingerprint", lambda: "changed")
+
+    assert processor._cache_path() != cache_path
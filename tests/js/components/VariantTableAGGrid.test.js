@@ -962,6 +962,7 @@ describe("VariantTableAGGrid - Field Metadata", () => {
     expect(metadata.POS.count).toBe(3);
     expect(metadata.POS.min).toBeLessThanOrEqual(1000);
     expect(metadata.POS.max).toBeGreaterThanOrEqual(3000);
+    expect(metadata.POS.uniqueValues).toBeUndefined();
   });
 
   it("counts non-null values correctly", async () => {
@@ -0,0 +1,54 @@
+/**
+ * Tests for BCFStatsParser
+ */
+
+import { describe, it, expect } from "vitest";
+import { parseBCFToolsStats } from "../../../../src/varify/assets/js/core/parsers/BCFStatsParser.js";
+
+describe("BCFStatsParser - parseBCFToolsStats", () => {
+  it("builds rows with named columns and numeric values", () => {
+    const content = [
+      "# SN, Summary numbers:",
+      "SN\t0\tnumber of samples:\t3",
+      "SN\t0\tnumber of records:\t1214",
+      "ST\t0\tINS\t42",
+    ].join("\n");
+
+    const result = parseBCFToolsStats(content);
+
+    expect(result.SN).toEqual([
+      { id: "0", key: "number of samples:", value: 3 },
+      { id: "0", key: "number of records:", value: 1214 },
+    ]);
+    expect(result.ST).toEqual([{ id: "0", type: "INS", count: 42 }]);
+  });
+
+  it("drops all-zero rows and empty sections", () => {
+    const content = [
+      "SN\t0\tnumber of SNPs:\t0",
+      "IDD\t0\t-5\t2\t0\t0",
+      "IDD\t0\t-4\t0\t0\t0",
+      "ST\t0\tDEL\t0",
+    ].join("\n");
+
+    const result = parseBCFToolsStats(content);
+
+    expect(result.SN).toBeUndefined();
+    expect(result.ST).toBeUndefined();
+    expect(result.IDD).toEqual([
+      {
+        id: "0",
+        "length (deletions negative)": "-5",
+        "number of sites": 2,
+        "number of genotypes": 0,
+        "mean VAF": 0,
+      },
+    ]);
+  });
+
+  it("ignores unknown sections and comment lines", () => {
+    const content = ["# comment", "ID\t0\tinput.vcf", "HWE\t0\t0.0\t1\t0\t0\t0"].join("\n");
+
+    expect(parseBCFToolsStats(content)).toEqual({});
+  });
+});
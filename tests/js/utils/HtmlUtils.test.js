@@ -0,0 +1,23 @@
+/**
+ * Tests for HtmlUtils
+ */
+
+import { describe, it, expect } from "vitest";
+import { escapeHtml } from "../../../src/varify/assets/js/utils/HtmlUtils.js";
+
+describe("HtmlUtils - escapeHtml", () => {
+  it("escapes markup and quote characters", () => {
+    expect(escapeHtml(`<a href="x">Tom & Jerry's</a>`)).toBe(
+      "&lt;a href=&quot;x&quot;&gt;Tom &amp; Jerry&#039;s&lt;/a&gt;"
+    );
+  });
+
+  it("leaves plain text unchanged", () => {
+    expect(escapeHtml("DEL")).toBe("DEL");
+  });
+
+  it("converts non-string values to strings", () => {
+    expect(escapeHtml(42)).toBe("42");
+    expect(escapeHtml(null)).toBe("null");
+  });
+});
@@ -2,14 +2,23 @@
 Integration tests for report generation.
 """
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from src.varify.core.vcf_parser import VcfType, parse_vcf
-from src.varify.reporting.html_generator import generate_combined_report
+from src.varify.reporting.html_generator import (
+    copy_if_changed,
+    count_unique,
+    generate_combined_report,
+    load_report_shell,
+    summarize_sv,
+)
 
 
 @pytest.fixture
@@ -140,6 +149,49 @@ def test_report_handles_missing_survivor_data(
     assert output_path.exists(), "Report without SURVIVOR should be created"
 
 
+def test_report_uses_precomputed_summary(sample_vcf_path, temp_output_dir):
+    """Test a precomputed summary is embedded without passing a DataFrame."""
+    output_path = temp_output_dir / "test_report_summary.html"
+    summary = {"total_sv": 42, "unique_sv": 3, "mqs": 12.5}
+
+    generate_combined_report(
+        combined_report_file=str(output_path),
+        bcf_vcf_path=str(sample_vcf_path),
+        survivor_vcf_path=None,
+        fasta_path=None,
+        bcf_df=None,
+        survivor_df=None,
+        profiles=[],
+        reference_name=None,
+        bcf_summary=summary,
+    )
+
+    html_content = output_path.read_text(encoding="utf-8")
+    assert '"summary": {"total_sv": 42, "unique_sv": 3, "mqs": 12.5}' in html_content
+    assert '"survivor": null' in html_content
+
+
+def test_report_metadata_cannot_close_script_tag(sample_vcf_path, temp_output_dir):
+    """Test user-supplied metadata is escaped inside the metadata script."""
+    output_path = temp_output_dir / "test_report_escaped.html"
+
+    generate_combined_report(
+        combined_report_file=str(output_path),
+        bcf_vcf_path=str(sample_vcf_path),
+        survivor_vcf_path=None,
+        fasta_path=None,
+        bcf_df=None,
+        survivor_df=None,
+        profiles="</script><script>alert(1)</script>",
+        reference_name=None,
+        bcf_summary={"total_sv": 1, "unique_sv": 1, "mqs": "N/A"},
+    )
+
+    html_content = output_path.read_text(encoding="utf-8")
+    assert "</script><script>alert(1)" not in html_content
+    assert '"profiles": "\\u003c/script>\\u003cscript>alert(1)\\u003c/script>"' in html_content
+
+
 def test_report_contains_javascript_bundle(
     sample_data,
     sample_vcf_path,
@@ -167,6 +219,97 @@ def test_report_contains_javascript_bundle(
     assert "<script>" in html_content, "Should contain embedded JavaScript"
 
 
+def test_summarize_sv_values():
+    """Test summary counts, distinct SV types and median QUAL ignoring missing values."""
+    df = pd.DataFrame({"SVTYPE": ["DEL", "DEL", "INS", "DUP"], "QUAL": [10.0, np.nan, 20.0, 35.5]})
+
+    assert summarize_sv(df) == {"total_sv": 4, "unique_sv": 3, "mqs": 20.0}
+
+
+def test_count_unique_categorical_ignores_unused_and_missing():
+    """Test categorical distinct counts skip unused categories and missing values."""
+    series = pd.Series(
+        pd.Categorical(["DEL", None, "DEL", "INS"], categories=["BND", "DEL", "DUP", "INS"])
+    )
+
+    assert count_unique(series) == 2
+    assert count_unique(series.astype(object)) == 2
+    assert count_unique(series.iloc[:0]) == 0
+
+
+def test_summarize_sv_missing_quality():
+    """Test median QUAL falls back to N/A when QUAL is missing or all NaN."""
+    all_nan = pd.DataFrame({"SVTYPE": ["DEL"], "QUAL": [None]})
+    no_qual = pd.DataFrame({"SVTYPE": ["DEL"]})
+
+    assert summarize_sv(all_nan)["mqs"] == "N/A"
+    assert summarize_sv(no_qual)["mqs"] == "N/A"
+    assert summarize_sv(None) is None
+
+
+def test_copy_if_changed_skips_unchanged_file(temp_output_dir):
+    """Test an identical earlier copy is reused and a modified source is recopied."""
+    src = temp_output_dir / "reference.fna"
+    dest = temp_output_dir / "copy.fna"
+    src.write_text(">chr1\nACGT\n")
+
+    assert copy_if_changed(str(src), str(dest)) is True
+    assert copy_if_changed(str(src), str(dest)) is False
+
+    src.write_text(">chr1\nACGTACGT\n")
+    assert copy_if_changed(str(src), str(dest)) is True
+    assert dest.read_text() == ">chr1\nACGTACGT\n"
+
+
+def test_copy_if_changed_recopies_same_second_rewrite(temp_output_dir):
+    """Test a same-size rewrite within the same second as the earlier copy is recopied."""
+    src = temp_output_dir / "reference.fna"
+    dest = temp_output_dir / "copy.fna"
+    src.write_text(">chr1\nACGT\n")
+    os.utime(src, ns=(1_700_000_000_100_000_000, 1_700_000_000_100_000_000))
+    assert copy_if_changed(str(src), str(dest)) is True
+
+    src.write_text(">chr1\nTTTT\n")
+    os.utime(src, ns=(1_700_000_000_600_000_000, 1_700_000_000_600_000_000))
+
+    assert copy_if_changed(str(src), str(dest)) is True
+    assert dest.read_text() == ">chr1\nTTTT\n"
+
+
+def test_load_report_shell_rereads_modified_file(temp_output_dir):
+    """Test the cached shell is rebuilt when the template changes."""
+    template = temp_output_dir / "template.html"
+    bundle_js = temp_output_dir / "bundle.js"
+    bundle_css = temp_output_dir / "bundle.css"
+    template.write_text("<html>v1</html>", encoding="utf-8")
+    bundle_js.write_text("", encoding="utf-8")
+    bundle_css.write_text("", encoding="utf-8")
+
+    paths = (str(template), str(bundle_js), str(bundle_css))
+    assert load_report_shell(*paths) == (b"<html>v1</html>",)
+
+    template.write_text("<html>version 2</html>", encoding="utf-8")
+    assert load_report_shell(*paths) == (b"<html>version 2</html>",)
+
+
+def test_load_report_shell_inlines_and_splits_once(temp_output_dir):
+    """Test bundles are inlined, the shell is split at the metadata and the result is reused."""
+    template = temp_output_dir / "template.html"
+    bundle_js = temp_output_dir / "bundle.js"
+    bundle_css = temp_output_dir / "bundle.css"
+    template.write_text(
+        "<!-- BUNDLE_CSS --><!-- REPORT_METADATA --><!-- BUNDLE_JS -->", encoding="utf-8"
+    )
+    bundle_js.write_text("var a = 1;", encoding="utf-8")
+    bundle_css.write_text("body {}", encoding="utf-8")
+
+    paths = (str(template), str(bundle_js), str(bundle_css))
+    shell = load_report_shell(*paths)
+
+    assert shell == (b"<style>body {}</style>", b"<script>var a = 1;</script>")
+    assert load_report_shell(*paths) is shell
+
+
 def test_vcf_parser_integration(sample_vcf_path):
     """Integration test for VCF parsing."""
     # Parse VCF